@@ -2,9 +2,348 @@
 Financial calculation utilities for the Investment Finance Calculator
 """
 
+import math
+from functools import lru_cache
 import numpy as np
+from numpy.polynomial.polynomial import polyval
 from typing import List, Dict, Optional, Tuple
 
+
+def _as_float_list(cashflows) -> List[float]:
+    """Convert cash flows to a list of Python floats for the scalar kernels"""
+    if isinstance(cashflows, (list, tuple)):
+        # Short lists are cheaper to convert directly than via NumPy
+        return [float(cf) for cf in cashflows]
+    return np.ascontiguousarray(cashflows, dtype=np.float64).tolist()
+
+
+def _compound_factor(rate: float, periods: float) -> float:
+    """(1 + rate) ** periods, via log1p/expm1 for small rates"""
+    if abs(rate) < 1e-4:
+        return 1.0 + math.expm1(periods * math.log1p(rate))
+    return math.pow(1.0 + rate, periods)
+
+
+def _present_value(future_value: float, rate: float, periods: float) -> float:
+    """Discount a single future amount"""
+    return future_value / _compound_factor(rate, periods)
+
+
+def _future_value(present_value: float, rate: float, periods: float) -> float:
+    """Compound a single present amount"""
+    return present_value * _compound_factor(rate, periods)
+
+
+def _cagr(beginning_value: float, ending_value: float, periods: float) -> float:
+    """Compound annual growth rate; expm1 keeps precision for small growth"""
+    ratio = ending_value / beginning_value
+    if ratio == 0:
+        return -1.0  # Total loss
+    return math.expm1(math.log(ratio) / periods)
+
+
+def _npv_horner(rate: float, cfs: List[float]) -> float:
+    """Evaluate the NPV polynomial in 1/(1+rate) with Horner's rule"""
+    disc = 1.0 / (1.0 + rate)
+    acc = 0.0
+    for cf in reversed(cfs):
+        acc = acc * disc + cf
+    return acc
+
+
+# Fine rate grid used to bracket the IRR before Newton refinement
+_IRR_GRID = np.linspace(-0.99, 10.0, 256)
+
+
+def _discount_distance(rate, guess: float):
+    """
+    How far a rate lies from the guess, measured between discount factors
+    1/(1+r). Distances in rate itself would favour spurious roots near -100%
+    over genuine high IRRs, because the rate axis is compressed there.
+    """
+    return np.abs(1.0 / (1.0 + rate) - 1.0 / (1.0 + guess))
+
+
+@lru_cache(maxsize=16)
+def _irr_grid_discounts(periods: int) -> np.ndarray:
+    """(periods, grid) matrix of discount factors, so cfs @ it is NPV at every grid rate"""
+    with np.errstate(over='ignore'):
+        table = (1.0 + _IRR_GRID[None, :]) ** -np.arange(periods, dtype=np.float64)[:, None]
+    table.flags.writeable = False
+    return table
+
+
+def _irr_bracket(cfs: List[float], guess: float = 0.1) -> Optional[float]:
+    """
+    Locate an IRR seed from the NPV sign change nearest the guess, with NPV
+    evaluated at every grid rate in one matrix product
+    
+    Returns:
+        Seed rate interpolated within the bracket, or None if NPV never
+        changes sign on the grid
+    """
+    # Long series overflow at the most negative grid rates; those NPVs are
+    # inf/NaN and simply never bracket the root
+    with np.errstate(over='ignore', invalid='ignore'):
+        npvs = np.asarray(cfs) @ _irr_grid_discounts(len(cfs))
+    positive = npvs > 0
+    changes = np.flatnonzero(positive[1:] != positive[:-1])
+    if changes.size == 0:
+        return None
+    
+    # Of the sign changes either side of the guess, take the closer one
+    j = int(np.searchsorted(changes, np.searchsorted(_IRR_GRID, guess)))
+    candidates = changes[max(j - 1, 0):j + 1]
+    i = candidates[_discount_distance(_IRR_GRID[candidates], guess).argmin()]
+    
+    lo, hi = float(_IRR_GRID[i]), float(_IRR_GRID[i + 1])
+    f_lo, f_hi = float(npvs[i]), float(npvs[i + 1])
+    return lo - f_lo * (hi - lo) / (f_hi - f_lo)
+
+
+def _irr_newton(cfs: List[float], guess: float = 0.1, tol: float = 1e-6,
+                max_iter: int = 100) -> Optional[float]:
+    """Newton-Raphson IRR kernel computing NPV and its derivative in one pass"""
+    # Derivative weights i * cf_i do not depend on the rate; pair them with
+    # the cash flows in reverse order for Horner evaluation
+    terms = [(cf, i * cf) for i, cf in enumerate(cfs)][::-1]
+    
+    rate = guess
+    for _ in range(max_iter):
+        disc = 1.0 / (1.0 + rate)
+        npv_val = 0.0
+        dnpv = 0.0
+        for cf, w in terms:
+            npv_val = npv_val * disc + cf
+            dnpv = dnpv * disc + w
+        dnpv *= -disc
+        
+        if abs(npv_val) < tol:
+            return rate
+        if abs(dnpv) < 1e-10:
+            break
+        
+        rate = rate - npv_val / dnpv
+        
+        # Diverged outside the economically meaningful range
+        if rate < -0.999 or abs(rate) > 1e3:
+            break
+    
+    return None
+
+
+def _irr_bracket_rows(cfs: np.ndarray, guess: float = 0.1) -> np.ndarray:
+    """Vectorised _irr_bracket over the rows of a cash flow matrix (NaN if none)"""
+    npvs = cfs @ _irr_grid_discounts(cfs.shape[1])
+    positive = npvs > 0
+    found = positive[:, 1:] != positive[:, :-1]
+    
+    # Sign change nearest the guess in each row
+    distance = np.where(found, _discount_distance(_IRR_GRID[:-1], guess), np.inf)
+    idx = distance.argmin(axis=1)
+    rows = np.arange(cfs.shape[0])
+    
+    lo, hi = _IRR_GRID[idx], _IRR_GRID[idx + 1]
+    f_lo, f_hi = npvs[rows, idx], npvs[rows, idx + 1]
+    seed = lo - f_lo * (hi - lo) / (f_hi - f_lo)
+    seed[~found[rows, idx]] = np.nan
+    return seed
+
+
+def _irr_newton_rows(cfs: np.ndarray, guess: np.ndarray, tol: float = 1e-6,
+                     max_iter: int = 100) -> np.ndarray:
+    """Vectorised _irr_newton over the rows of a cash flow matrix (NaN if none)"""
+    weights = cfs * np.arange(cfs.shape[1], dtype=np.float64)
+    result = np.full(cfs.shape[0], np.nan)
+    rate = np.array(guess, dtype=np.float64)
+    active = np.flatnonzero(~np.isnan(rate))
+    
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        r = rate[active]
+        disc = 1.0 / (1.0 + r)
+        npv_val = np.zeros(active.size)
+        dnpv = np.zeros(active.size)
+        for j in range(cfs.shape[1] - 1, -1, -1):
+            npv_val = npv_val * disc + cfs[active, j]
+            dnpv = dnpv * disc + weights[active, j]
+        dnpv *= -disc
+        
+        converged = np.abs(npv_val) < tol
+        result[active[converged]] = r[converged]
+        
+        # Same stopping rules as the scalar kernel: flat derivative or divergence
+        keep = ~converged & (np.abs(dnpv) >= 1e-10)
+        r = r[keep] - npv_val[keep] / dnpv[keep]
+        active = active[keep]
+        keep = (r >= -0.999) & (np.abs(r) <= 1e3)
+        active = active[keep]
+        rate[active] = r[keep]
+    
+    return result
+
+
+def _irr_roots(cfs: List[float], guess: float = 0.1) -> Optional[float]:
+    """
+    IRR from the eigenvalues of the NPV polynomial's companion matrix
+    
+    Roots of sum(cf_i * (1+r)^(n-1-i)) are values of 1+r; among the real
+    positive ones the rate nearest the guess is returned, by the same
+    measure _irr_bracket uses.
+    """
+    if not np.isfinite(cfs).all():
+        return None
+    roots = np.roots(cfs)
+    real = roots[np.abs(roots.imag) < 1e-9].real
+    rates = real[real > 0] - 1
+    if rates.size == 0:
+        return None
+    return float(rates[_discount_distance(rates, guess).argmin()])
+
+
+def _bond_present_values(
+    face_value: float,
+    coupon_rate: float,
+    yield_rate: float,
+    years_to_maturity: int,
+    payments_per_year: int
+) -> Tuple[float, float]:
+    """Present value of a bond's coupons and of its face value"""
+    periods = years_to_maturity * payments_per_year
+    coupon_payment = (face_value * coupon_rate) / payments_per_year
+    period_yield = yield_rate / payments_per_year
+    
+    # Present value of coupon payments (annuity). log1p/expm1 avoid the
+    # cancellation in 1 - (1+y)^-n for small yields; near zero use the
+    # first-order Taylor expansion n * (1 - (n+1) * y / 2)
+    if abs(period_yield) > 1e-8:
+        annuity_factor = -math.expm1(-periods * math.log1p(period_yield)) / period_yield
+    else:
+        annuity_factor = periods * (1 - (periods + 1) * period_yield / 2)
+    pv_coupons = coupon_payment * annuity_factor
+    
+    # Present value of face value
+    pv_face_value = face_value / (1 + period_yield) ** periods
+    
+    return pv_coupons, pv_face_value
+
+
+def _bond_price_only(
+    face_value: float,
+    coupon_rate: float,
+    yield_rate: float,
+    years_to_maturity: int,
+    payments_per_year: int
+) -> float:
+    """Bond price without the duration or result dict, for root-finding"""
+    pv_coupons, pv_face_value = _bond_present_values(
+        face_value, coupon_rate, yield_rate, years_to_maturity, payments_per_year
+    )
+    return pv_coupons + pv_face_value
+
+
+def _bond_duration(
+    face_value: float,
+    coupon_rate: float,
+    yield_rate: float,
+    years_to_maturity: int,
+    payments_per_year: int,
+    bond_price: float
+) -> float:
+    """Macaulay duration in years of a bond trading at bond_price"""
+    periods = years_to_maturity * payments_per_year
+    period_yield = yield_rate / payments_per_year
+    
+    if coupon_rate == 0:
+        # A zero-coupon bond's only cash flow is at maturity
+        return periods / payments_per_year
+    
+    if abs(period_yield) > 1e-4 and periods > 0:
+        # Closed-form Macaulay duration (in periods) of a level-coupon bond;
+        # its (1+y)/y terms cancel badly for small yields, handled below
+        y = period_yield
+        c = coupon_rate / payments_per_year
+        n = periods
+        return ((1 + y) / y - (1 + y + n * (c - y)) /
+                (c * ((1 + y) ** n - 1) + y)) / payments_per_year
+    
+    # Near-zero yield: weight each discounted cash flow by its time directly
+    coupon_payment = (face_value * coupon_rate) / payments_per_year
+    t = np.arange(1, periods + 1, dtype=np.float64)
+    cash_flows = np.full(periods, coupon_payment)
+    cash_flows[-1:] += face_value
+    # Discount factors by running product rather than a power per period
+    discount_factors = np.cumprod(np.full(periods, 1.0 / (1.0 + period_yield)))
+    weighted_time = float((t * cash_flows) @ discount_factors) / payments_per_year
+    
+    return weighted_time / bond_price
+
+
+def _bond_yield_derivatives(
+    face_value: float,
+    coupon_rate: float,
+    yield_rate: float,
+    years_to_maturity: int,
+    payments_per_year: int
+) -> Tuple[float, float]:
+    """First and second derivatives of bond price with respect to annual yield"""
+    periods = years_to_maturity * payments_per_year
+    coupon_payment = (face_value * coupon_rate) / payments_per_year
+    r = yield_rate / payments_per_year
+    n = periods
+    
+    if abs(r) > 1e-4:
+        # Differentiate the closed form P = coupon * A(r) + face * (1+r)^-n,
+        # where A(r) = g(r) / r and g(r) = 1 - (1+r)^-n
+        v_n = (1 + r) ** -n
+        g = -math.expm1(-n * math.log1p(r))
+        g1 = n * v_n / (1 + r)
+        g2 = -(n + 1) * g1 / (1 + r)
+        a1 = (g1 - g / r) / r
+        a2 = (g2 - 2 * a1) / r
+        d1 = coupon_payment * a1 - n * face_value * v_n / (1 + r)
+        d2 = coupon_payment * a2 + n * (n + 1) * face_value * v_n / (1 + r) ** 2
+    else:
+        # Near zero yield the closed form cancels; sum the cash flows instead
+        t = np.arange(1, periods + 1, dtype=np.float64)
+        cash_flows = np.full(periods, coupon_payment, dtype=np.float64)
+        if periods:
+            cash_flows[-1] += face_value
+        pv_cash_flows = cash_flows * (1 + r) ** -t
+        d1 = -float(np.dot(t, pv_cash_flows)) / (1 + r)
+        d2 = float(np.dot(t * (t + 1), pv_cash_flows)) / (1 + r) ** 2
+    
+    # Chain rule through r = yield_rate / payments_per_year
+    return d1 / payments_per_year, d2 / payments_per_year ** 2
+
+
+def _bond_metrics(
+    face_value: float,
+    coupon_rate: float,
+    yield_rate: float,
+    years_to_maturity: int,
+    payments_per_year: int
+) -> Tuple[float, float, float, float, float]:
+    """
+    Price a fixed-coupon bond
+    
+    Returns:
+        Tuple of (price, pv_coupons, pv_face_value, macaulay_duration, coupon_payment)
+        where coupon_payment is the per-period coupon
+    """
+    coupon_payment = (face_value * coupon_rate) / payments_per_year
+    pv_coupons, pv_face_value = _bond_present_values(
+        face_value, coupon_rate, yield_rate, years_to_maturity, payments_per_year
+    )
+    bond_price = pv_coupons + pv_face_value
+    duration = _bond_duration(
+        face_value, coupon_rate, yield_rate, years_to_maturity, payments_per_year, bond_price
+    )
+    
+    return bond_price, pv_coupons, pv_face_value, duration, coupon_payment
+
+
 class FinancialCalculations:
     """Core financial calculation methods"""
     
@@ -15,41 +354,82 @@ class FinancialCalculations:
         
         Args:
             rate: Discount rate (as decimal, e.g., 0.1 for 10%)
-            cashflows: List of cash flows, with initial investment as negative
+            cashflows: List or array of cash flows, with initial investment as negative
         
         Returns:
             NPV value
         """
-        return sum(cf / (1 + rate) ** i for i, cf in enumerate(cashflows))
-    
+        return _npv_horner(rate, _as_float_list(cashflows))
+
+    @staticmethod
+    def npv_batch(rates: np.ndarray, cashflows: np.ndarray) -> np.ndarray:
+        """
+        Calculate NPV for many discount rates and/or cash flow scenarios at once
+
+        Args:
+            rates: 1-D array of discount rates (as decimals)
+            cashflows: 1-D array of cash flows, or 2-D C-contiguous array
+                with one scenario per row (all scenarios share the same horizon)
+
+        Returns:
+            Array of shape (len(rates),) for 1-D cash flows, or
+            (len(rates), n_scenarios) for 2-D cash flows
+        """
+        rates = np.asarray(rates, dtype=np.float64)
+        cfs = np.asarray(cashflows, dtype=np.float64)
+        # NPV is a polynomial in 1/(1+rate); polyval runs Horner's rule in C
+        # over every rate at once instead of building a matrix of powers
+        return polyval(1.0 / (1.0 + rates), cfs.T).T
+
     @staticmethod
     def irr(cashflows: List[float], guess: float = 0.1) -> Optional[float]:
         """
-        Calculate Internal Rate of Return using Newton-Raphson method
+        Calculate Internal Rate of Return using Newton-Raphson method,
+        seeded from the NPV sign change nearest the guess on a fine rate
+        grid, falling back to polynomial roots when Newton fails
         
         Args:
             cashflows: List of cash flows
-            guess: Initial guess for IRR
+            guess: Rate near which to look for the IRR when there are several
         
         Returns:
             IRR as decimal or None if not found
         """
-        def npv_derivative(rate, cashflows):
-            return sum(-i * cf / (1 + rate) ** (i + 1) for i, cf in enumerate(cashflows))
+        cfs = _as_float_list(cashflows)
+        seed = _irr_bracket(cfs, guess)
+        rate = _irr_newton(cfs, seed) if seed is not None else None
+        if rate is None:
+            # Polynomial root-finding never fails to converge
+            rate = _irr_roots(cfs, guess)
+        return rate
+    
+    @staticmethod
+    def irr_batch(cashflows: np.ndarray, guess: float = 0.1) -> np.ndarray:
+        """
+        Calculate IRR for many cash flow scenarios at once, matching irr()
+        row by row
         
-        rate = guess
-        for _ in range(100):  # Max iterations
-            npv_val = FinancialCalculations.npv(rate, cashflows)
-            if abs(npv_val) < 1e-6:
-                return rate
-            
-            derivative = npv_derivative(rate, cashflows)
-            if abs(derivative) < 1e-10:
-                break
-            
-            rate = rate - npv_val / derivative
+        Args:
+            cashflows: 2-D array with one scenario per row. Callers sweeping
+                many scenarios should build a C-contiguous float64 matrix up
+                front rather than a list of lists.
+            guess: Rate near which to look for the IRR when there are several
         
-        return None
+        Returns:
+            Array of IRRs (as decimals), NaN where no IRR was found
+        """
+        cfs = np.ascontiguousarray(cashflows, dtype=np.float64)
+        # Every scenario advances one Newton step per array operation
+        with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+            seeds = _irr_bracket_rows(cfs, guess)
+            rates = _irr_newton_rows(cfs, seeds)
+        
+        # Rows the grid or Newton could not settle take irr()'s fallback
+        for row in np.flatnonzero(np.isnan(rates)):
+            rate = _irr_roots(cfs[row].tolist(), guess)
+            if rate is not None:
+                rates[row] = rate
+        return rates
     
     @staticmethod
     def payback_period(cashflows: List[float]) -> Optional[float]:
@@ -57,25 +437,53 @@ class FinancialCalculations:
         Calculate payback period
         
         Args:
-            cashflows: List of cash flows (first should be negative investment)
+            cashflows: List or array of cash flows (first should be negative investment)
         
         Returns:
             Payback period in years or None if never pays back
         """
-        if not cashflows or cashflows[0] >= 0:
+        cfs = np.asarray(cashflows, dtype=np.float64)
+        if cfs.size == 0 or cfs[0] >= 0:
             return None
         
-        cumulative = cashflows[0]
-        for i, cf in enumerate(cashflows[1:], 1):
-            cumulative += cf
-            if cumulative >= 0:
-                # Linear interpolation for fractional year
-                if i == 1:
-                    return i
-                prev_cumulative = cumulative - cf
-                return i - 1 + abs(prev_cumulative) / cf
+        # First year whose running total turns non-negative
+        cumulative = np.cumsum(cfs)
+        paid_back = cumulative >= 0
+        if not paid_back.any():
+            return None
+        i = int(paid_back.argmax())
         
-        return None
+        if i == 1:
+            return i
+        # Linear interpolation for fractional year
+        return i - 1 + abs(float(cumulative[i - 1])) / float(cfs[i])
+    
+    @staticmethod
+    def payback_period_batch(cashflows: np.ndarray) -> np.ndarray:
+        """
+        Calculate payback periods for many cash flow scenarios at once
+        
+        Args:
+            cashflows: 2-D array with one scenario per row
+        
+        Returns:
+            Array of payback periods in years, NaN where a scenario never pays back
+        """
+        cfs = np.asarray(cashflows, dtype=np.float64)
+        rows = np.arange(cfs.shape[0])
+        
+        # First year whose running total turns non-negative, per scenario
+        cumulative = np.cumsum(cfs, axis=1)
+        paid_back = cumulative >= 0
+        i = paid_back.argmax(axis=1)
+        valid = (cfs[:, 0] < 0) & paid_back[rows, i]
+        
+        # Linear interpolation for fractional year, as in payback_period
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction = np.abs(cumulative[rows, i - 1]) / cfs[rows, i]
+        result = np.where(i == 1, 1.0, i - 1 + fraction)
+        result[~valid] = np.nan
+        return result
     
     @staticmethod
     def dcf_valuation(
@@ -88,7 +496,7 @@ class FinancialCalculations:
         Discounted Cash Flow valuation
         
         Args:
-            free_cashflows: Projected free cash flows
+            free_cashflows: Projected free cash flows (list or array)
             terminal_growth_rate: Long-term growth rate for terminal value
             discount_rate: WACC or discount rate
             terminal_year: Year for terminal value calculation (default: last year)
@@ -96,28 +504,30 @@ class FinancialCalculations:
         Returns:
             Dictionary with valuation components
         """
+        cfs = np.asarray(free_cashflows, dtype=np.float64)
         if terminal_year is None:
-            terminal_year = len(free_cashflows)
+            terminal_year = cfs.size
         
-        # Present value of projected cash flows
-        pv_cashflows = [
-            cf / (1 + discount_rate) ** (i + 1) 
-            for i, cf in enumerate(free_cashflows)
-        ]
+        # Present value of projected cash flows: one vectorised power for
+        # the discount factors, then a dot product for the total
+        inv = 1.0 / (1.0 + discount_rate)
+        discount = inv ** np.arange(1, cfs.size + 1, dtype=np.float64)
+        pv_cashflows = cfs * discount
+        pv_total = float(cfs @ discount)
         
         # Terminal value
-        terminal_cf = free_cashflows[-1] * (1 + terminal_growth_rate)
+        terminal_cf = float(cfs[-1]) * (1 + terminal_growth_rate)
         terminal_value = terminal_cf / (discount_rate - terminal_growth_rate)
-        pv_terminal_value = terminal_value / (1 + discount_rate) ** terminal_year
+        pv_terminal_value = terminal_value * inv ** terminal_year
         
-        enterprise_value = sum(pv_cashflows) + pv_terminal_value
+        enterprise_value = pv_total + pv_terminal_value
         
         return {
-            'pv_cashflows': sum(pv_cashflows),
+            'pv_cashflows': pv_total,
             'terminal_value': terminal_value,
             'pv_terminal_value': pv_terminal_value,
             'enterprise_value': enterprise_value,
-            'cashflow_breakdown': pv_cashflows
+            'cashflow_breakdown': pv_cashflows.tolist()
         }
     
     @staticmethod
@@ -180,17 +590,17 @@ class FinancialCalculations:
         Returns:
             CAGR as decimal
         """
-        return (ending_value / beginning_value) ** (1 / periods) - 1
+        return _cagr(beginning_value, ending_value, periods)
     
     @staticmethod
     def present_value(future_value: float, rate: float, periods: int) -> float:
         """Calculate present value"""
-        return future_value / (1 + rate) ** periods
+        return _present_value(future_value, rate, periods)
     
     @staticmethod
     def future_value(present_value: float, rate: float, periods: int) -> float:
         """Calculate future value"""
-        return present_value * (1 + rate) ** periods
+        return _future_value(present_value, rate, periods)
     
     @staticmethod
     def bond_price(
@@ -213,39 +623,13 @@ class FinancialCalculations:
         Returns:
             Dictionary with bond pricing information
         """
-        periods = years_to_maturity * payments_per_year
-        coupon_payment = (face_value * coupon_rate) / payments_per_year
-        period_yield = yield_rate / payments_per_year
-        
-        # Present value of coupon payments (annuity)
-        if period_yield == 0:
-            pv_coupons = coupon_payment * periods
-        else:
-            pv_coupons = coupon_payment * (1 - (1 + period_yield) ** -periods) / period_yield
-        
-        # Present value of face value
-        pv_face_value = face_value / (1 + period_yield) ** periods
-        
-        # Bond price
-        bond_price = pv_coupons + pv_face_value
+        bond_price, pv_coupons, pv_face_value, duration, coupon_payment = _bond_metrics(
+            face_value, coupon_rate, yield_rate, years_to_maturity, payments_per_year
+        )
         
         # Current yield
         current_yield = (coupon_payment * payments_per_year) / bond_price
         
-        # Duration calculation (inline to avoid recursion)
-        weighted_time = 0
-        for t in range(1, periods + 1):
-            if t == periods:
-                # Final payment includes face value
-                cash_flow = coupon_payment + face_value
-            else:
-                cash_flow = coupon_payment
-            
-            pv_cash_flow = cash_flow / (1 + period_yield) ** t
-            weighted_time += (t / payments_per_year) * pv_cash_flow
-        
-        duration = weighted_time / bond_price
-        
         return {
             'bond_price': bond_price,
             'pv_coupons': pv_coupons,
@@ -267,7 +651,8 @@ class FinancialCalculations:
         guess: float = 0.05
     ) -> Optional[float]:
         """
-        Calculate yield to maturity using Newton-Raphson method
+        Calculate yield to maturity using Halley's method with the analytic
+        first and second price derivatives
         
         Args:
             bond_price: Current market price of bond
@@ -280,28 +665,24 @@ class FinancialCalculations:
         Returns:
             YTM as decimal or None if not found
         """
-        def bond_price_function(ytm):
-            result = FinancialCalculations.bond_price(
-                face_value, coupon_rate, ytm, years_to_maturity, payments_per_year
-            )
-            return result['bond_price'] - bond_price
-        
-        def bond_price_derivative(ytm):
-            # Numerical derivative
-            h = 0.0001
-            return (bond_price_function(ytm + h) - bond_price_function(ytm - h)) / (2 * h)
-        
         ytm = guess
         for _ in range(100):  # Max iterations
-            price_diff = bond_price_function(ytm)
+            price = _bond_price_only(
+                face_value, coupon_rate, ytm, years_to_maturity, payments_per_year
+            )
+            price_diff = price - bond_price
             if abs(price_diff) < 0.01:  # Close enough
                 return ytm
             
-            derivative = bond_price_derivative(ytm)
-            if abs(derivative) < 1e-10:
+            # Halley step using the analytic first and second derivatives
+            d1, d2 = _bond_yield_derivatives(
+                face_value, coupon_rate, ytm, years_to_maturity, payments_per_year
+            )
+            denominator = 2 * d1 * d1 - price_diff * d2
+            if abs(d1) < 1e-10 or abs(denominator) < 1e-10:
                 break
             
-            ytm = ytm - price_diff / derivative
+            ytm = ytm - 2 * price_diff * d1 / denominator
             
             # Keep YTM reasonable
             if ytm < -0.5 or ytm > 1.0:
@@ -5,17 +5,103 @@ A calculator app inspired by iPhone calculator but focused on investment analysi
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog, filedialog
-import numpy as np
+from tkinter import filedialog
+from tkinter import font as tkfont
 import json
-import csv
 from datetime import datetime
+from functools import lru_cache
+import operator as _operator
 import os
+import re
 from typing import List, Dict, Optional
-from finance_utils import FinancialCalculations
 from scientific_calc import ScientificCalculator, ScientificButtonLayout, format_scientific_result
 
+# Display operator glyphs normalised to ASCII for dispatch in calculate()
+_OPERATOR_TABLE = str.maketrans({'×': '*', '÷': '/', '−': '-'})
+_OPERATIONS = {
+    '+': _operator.add,
+    '-': _operator.sub,
+    '*': _operator.mul,
+    '/': _operator.truediv
+}
+# Keypad glyphs resolved ahead of time, so presses need a single lookup
+_KEYPAD_OPERATIONS = {
+    glyph: _OPERATIONS[glyph.translate(_OPERATOR_TABLE)] for glyph in '+−×÷'
+}
+
+# Keyboard shortcuts: typed characters (or keysyms) to keypad labels
+_KEY_LABELS = {
+    **{digit: digit for digit in '0123456789'},
+    '.': '.', '+': '+', '-': '−', '*': '×', '/': '÷', '=': '=',
+    'Return': '=', 'KP_Enter': '=', 'Escape': 'C'
+}
+_BASIC_KEY_LABELS = {**_KEY_LABELS, '%': '%'}
+_SCIENTIFIC_KEY_LABELS = {**_KEY_LABELS, '(': '(', ')': ')', 'BackSpace': '⌫'}
+
+# Per-year projection line formatter, bound once at import
+_fmt_projection_line = "Year {}: ${:,.0f} (+{:.0f}%)".format
+
+# A comma plus any surrounding whitespace and further empty fields
+_BLANK_FIELDS = re.compile(r'\s*,[\s,]*')
+
+@lru_cache(maxsize=32)
+def parse_cashflows(text: str):
+    """
+    Parse comma-separated cash flows into a float64 array
+    
+    Accepts exactly what float() accepts per comma-separated field, skipping
+    empty fields. One regex substitution collapses separators and blank
+    fields, then np.fromstring converts every value in a single call; only
+    malformed input is reparsed field by field. Results are cached by text
+    so recalculating with unchanged cash flows skips the parse; the returned
+    array is read-only because it is shared.
+    """
+    import numpy as np
+    import warnings
+    
+    # np.fromstring rejects "1,,2" and reads a blank field such as the tail
+    # of "1, " as -1.0, so hand it bare values joined by single commas
+    values = _BLANK_FIELDS.sub(',', text).strip().strip(',')
+    
+    with warnings.catch_warnings():
+        # Older NumPy only warns (and truncates) on malformed input
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            cashflows = np.fromstring(values, sep=',', dtype=np.float64)
+        except (ValueError, DeprecationWarning):
+            # Reparse token by token so the error names the bad entry,
+            # e.g. "could not convert string to float: 'abc'"
+            cashflows = np.array([float(field.strip()) for field in text.split(',') if field.strip()],
+                                 dtype=np.float64)
+    
+    cashflows.flags.writeable = False
+    return cashflows
+
 class FinanceCalculator:
+    # Fixed attribute set: keypad handlers read these on every press, and a
+    # misspelt assignment fails loudly instead of creating a stray attribute
+    __slots__ = (
+        # Window, display and keypad state
+        'root', 'display', 'display_var', 'formula_display', 'formula_var',
+        'button_frame', 'sci_grid_frame', 'keypad_font', 'sci_keypad_font',
+        'current_mode', 'mode_frames', 'scroll_canvases', 'is_scientific_mode',
+        'current_input', 'operator', 'first_number', 'should_reset_display',
+        'current_value', 'current_value_text', 'entry_digits', 'entry_decimals',
+        'expression', 'pending_operation', 'waiting_for_operand', 'scientific_calc',
+        # Finance interface inputs and results
+        'rate_entry', 'cashflows_entry', 'cashflows_var',
+        'dcf_cashflows_entry', 'dcf_cashflows_var', 'terminal_growth_entry', 'wacc_entry',
+        'initial_cf_entry', 'growth_cf_entry', 'years_entry', 'cashflow_results',
+        'face_value_entry', 'coupon_rate_entry', 'yield_rate_entry', 'maturity_entry',
+        'payment_freq_entry', 'market_price_entry', 'bond_results',
+        # Data management
+        'history_file', 'calculation_history', 'favorites_file', 'favorites',
+        'last_calculation_data', 'show_summaries',
+    )
+    
+    # Anything str(float) can put on the display
+    NUMBER_PATTERN = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?|-?inf|nan')
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Investment Finance Calculator")
@@ -30,6 +116,14 @@ class FinanceCalculator:
         self.first_number = None
         self.should_reset_display = False
         
+        # Numeric value of the basic-mode display, valid while the display
+        # still shows current_value_text; digits typed into a fresh entry are
+        # accumulated as an integer mantissa and a count of decimal places
+        self.current_value = 0.0
+        self.current_value_text = "0"
+        self.entry_digits = 0
+        self.entry_decimals = None
+        
         # Scientific calculator state
         self.is_scientific_mode = False
         self.scientific_calc = ScientificCalculator()
@@ -44,6 +138,17 @@ class FinanceCalculator:
         self.favorites_file = "calculation_favorites.json"
         self.last_calculation_data = None
         
+        # Post-calculation summary dialogs are opt-in so they don't block
+        # rapid recalculation; export stays available from the menu bar
+        self.show_summaries = tk.BooleanVar(master=self.root, value=False)
+        
+        # Interface frames built once per mode (plus one per keypad layout,
+        # 'basic'/'scientific') and swapped in and out rather than rebuilt
+        self.mode_frames = {}
+        
+        # Canvases created by create_scrollable_area, scrolled by the wheel
+        self.scroll_canvases = set()
+        
         # Load existing data
         self.load_history()
         self.load_favorites()
@@ -80,6 +185,23 @@ class FinanceCalculator:
         )
         self.display.pack(fill='x')
         
+        # Shared button look, set once in the option database rather than
+        # passed to every tk.Button
+        self.root.option_add('*Button.background', '#d4d4d2')
+        self.root.option_add('*Button.foreground', '#1c1c1e')
+        self.root.option_add('*Button.relief', 'flat')
+        
+        # Named keypad fonts, resolved by Tk once and shared by every key
+        self.keypad_font = tkfont.Font(root=self.root, family='SF Pro Display', size=24)
+        self.sci_keypad_font = tkfont.Font(root=self.root, family='SF Pro Display', size=14)
+        
+        # Keyboard input for the calculator keypads
+        self.root.bind('<Key>', self.on_key)
+        
+        # One global wheel handler serves every scrollable mode interface
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind_all(sequence, self.on_mouse_wheel)
+        
         # Menu bar for data management
         menu_frame = tk.Frame(self.root, bg='#2c2c2e')
         menu_frame.pack(fill='x', padx=5, pady=2)
@@ -96,15 +218,24 @@ class FinanceCalculator:
                 menu_frame,
                 text=text,
                 command=command,
-                bg='#d4d4d2',
                 fg='black',
                 font=('SF Pro Display', 10, 'bold'),
-                relief='flat',
                 padx=8,
                 pady=2
             )
             btn.pack(side='left', padx=2)
         
+        tk.Checkbutton(
+            menu_frame,
+            text="Summaries",
+            variable=self.show_summaries,
+            bg='#2c2c2e',
+            fg='white',
+            selectcolor='#2c2c2e',
+            activebackground='#2c2c2e',
+            font=('SF Pro Display', 10)
+        ).pack(side='right', padx=2)
+        
         # Mode selector
         mode_frame = tk.Frame(self.root, bg='#1c1c1e')
         mode_frame.pack(fill='x', padx=10, pady=5)
@@ -115,10 +246,7 @@ class FinanceCalculator:
                 mode_frame,
                 text=text,
                 command=lambda m=mode: self.switch_mode(m),
-                bg='#d4d4d2',
-                fg='#1c1c1e',
                 font=('SF Pro Display', 12),
-                relief='flat',
                 padx=10
             )
             btn.pack(side='left', padx=2, expand=True, fill='x')
@@ -129,38 +257,52 @@ class FinanceCalculator:
         
         self.create_basic_buttons()
     
+    def clear_button_frame(self):
+        """Hide the current interface, keeping every cached frame for reuse"""
+        for frame in self.mode_frames.values():
+            frame.pack_forget()
+    
     def create_basic_buttons(self):
-        """Create basic calculator buttons with scientific toggle"""
+        """Show basic calculator buttons with scientific toggle"""
         # Clear existing buttons
-        for widget in self.button_frame.winfo_children():
-            widget.destroy()
+        self.clear_button_frame()
+        
+        layout = "scientific" if self.is_scientific_mode else "basic"
+        keypad = self.mode_frames.get(layout)
+        if keypad is None:
+            keypad = self.create_keypad()
+            self.mode_frames[layout] = keypad
+        keypad.pack(fill='both', expand=True)
+    
+    def create_keypad(self):
+        """Build the keypad for the current layout, including its toggle button"""
+        keypad = tk.Frame(self.button_frame, bg='#1c1c1e')
         
         # Add scientific toggle button
-        toggle_frame = tk.Frame(self.button_frame, bg='#1c1c1e')
+        toggle_frame = tk.Frame(keypad, bg='#1c1c1e')
         toggle_frame.pack(fill='x', pady=(0, 10))
         
         toggle_btn = tk.Button(
             toggle_frame,
             text="🧮 Scientific" if not self.is_scientific_mode else "🔢 Basic",
             command=self.toggle_scientific_mode,
-            bg='#d4d4d2',
-            fg='#1c1c1e',
             font=('SF Pro Display', 12, 'bold'),
-            relief='flat',
             padx=10
         )
         toggle_btn.pack()
         
         # Create appropriate button layout
         if self.is_scientific_mode:
-            self.create_scientific_buttons()
+            self.create_scientific_buttons(keypad)
         else:
-            self.create_basic_button_grid()
+            self.create_basic_button_grid(keypad)
+        
+        return keypad
     
-    def create_basic_button_grid(self):
+    def create_basic_button_grid(self, parent):
         """Create basic calculator button grid"""
         # Create a frame for the button grid
-        grid_frame = tk.Frame(self.button_frame, bg='#1c1c1e')
+        grid_frame = tk.Frame(parent, bg='#1c1c1e')
         grid_frame.pack(fill='both', expand=True)
         
         buttons = [
@@ -180,8 +322,11 @@ class FinanceCalculator:
                 else:
                     btn = self.create_grid_button(btn_text, i, j, grid_frame)
     
-    def create_scientific_buttons(self):
+    def create_scientific_buttons(self, parent):
         """Create scientific calculator button grid"""
+        self.sci_grid_frame = tk.Frame(parent, bg='#1c1c1e')
+        self.sci_grid_frame.pack(fill='both', expand=True)
+        
         buttons = [
             ['2nd', 'π', 'e', 'C', '⌫'],
             ['x²', '1/x', '|x|', 'exp', 'mod'],
@@ -207,27 +352,15 @@ class FinanceCalculator:
         self.is_scientific_mode = not self.is_scientific_mode
         self.expression = ""  # Clear expression when switching modes
         self.display_var.set("0")
-        self.create_basic_buttons()  # Recreate buttons with new mode
+        self.create_basic_buttons()  # Swap in the keypad for the new mode
     
     def create_button(self, text, row, col, columnspan=1):
         """Create a calculator button (for scientific mode)"""
-        # Create a frame for the scientific button grid if it doesn't exist
-        if not hasattr(self, 'sci_grid_frame'):
-            self.sci_grid_frame = tk.Frame(self.button_frame, bg='#1c1c1e')
-            self.sci_grid_frame.pack(fill='both', expand=True)
-        
-        # Button styling - all buttons use the same light gray color
-        bg_color = '#d4d4d2'  # Light gray for all buttons
-        fg_color = '#1c1c1e'  # Dark text for all buttons
-        
         btn = tk.Button(
             self.sci_grid_frame,
             text=text,
-            font=('SF Pro Display', 14),  # Smaller font for scientific mode
-            bg=bg_color,
-            fg=fg_color,
-            relief='flat',
-            command=lambda: self.button_click(text)
+            font=self.sci_keypad_font,  # Smaller font for scientific mode
+            command=lambda t=text: self.button_click(t)
         )
         
         btn.grid(row=row, column=col, columnspan=columnspan, 
@@ -241,18 +374,11 @@ class FinanceCalculator:
     
     def create_grid_button(self, text, row, col, parent_frame, columnspan=1):
         """Create a calculator button for basic mode"""
-        # Button styling - all buttons use the same light gray color
-        bg_color = '#d4d4d2'  # Light gray for all buttons
-        fg_color = '#1c1c1e'  # Dark text for all buttons
-        
         btn = tk.Button(
             parent_frame,
             text=text,
-            font=('SF Pro Display', 24),
-            bg=bg_color,
-            fg=fg_color,
-            relief='flat',
-            command=lambda: self.button_click(text)
+            font=self.keypad_font,
+            command=lambda t=text: self.button_click(t)
         )
         
         btn.grid(row=row, column=col, columnspan=columnspan, 
@@ -264,6 +390,16 @@ class FinanceCalculator:
         
         return btn
     
+    def on_key(self, event):
+        """Drive the keypad from the keyboard while a calculator layout is shown"""
+        if self.current_mode != "basic" or isinstance(event.widget, (tk.Entry, tk.Text)):
+            return
+        
+        labels = _SCIENTIFIC_KEY_LABELS if self.is_scientific_mode else _BASIC_KEY_LABELS
+        label = labels.get(event.char) or labels.get(event.keysym)
+        if label:
+            self.button_click(label)
+    
     def button_click(self, text):
         """Handle button clicks for both basic and scientific modes"""
         current = self.display_var.get()
@@ -275,25 +411,51 @@ class FinanceCalculator:
             # Scientific calculator mode
             self.handle_scientific_button_click(text, current)
     
+    def set_display_value(self, display, value):
+        """Show a basic-mode value and cache it alongside its display text"""
+        self.display_var.set(display)
+        self.current_value = value
+        self.current_value_text = display
+    
+    def show_result(self, value):
+        """Display a computed value to 12 significant digits, hiding float noise"""
+        if value == 0:
+            # Show -0.0 (e.g. from ± on 0) as "0" so the next digit replaces it
+            value = 0.0
+        self.set_display_value(format(value, '.12g'), value)
+    
+    def display_value(self, current):
+        """Numeric value of the display, parsing it only if the cache is stale"""
+        if current == self.current_value_text:
+            return self.current_value
+        return float(current)
+    
+    def is_display_number(self, current):
+        """Whether the display holds a number, without raising on e.g. 'Error'"""
+        return current == self.current_value_text or bool(self.NUMBER_PATTERN.fullmatch(current))
+    
     def handle_basic_button_click(self, text, current):
         """Handle basic calculator button clicks"""
         if text == 'C':
             # Clear everything
-            self.display_var.set("0")
+            self.set_display_value("0", 0.0)
+            self.entry_digits = 0
+            self.entry_decimals = None
             self.current_input = ""
             self.operator = None
             self.first_number = None
             self.should_reset_display = False
             
-        elif text in ['÷', '×', '−', '+']:
+        elif text in '÷×−+':
             # Handle operators
             if self.first_number is None:
-                self.first_number = float(current)
+                self.first_number = self.display_value(current)
             elif self.operator and not self.should_reset_display:
                 # Chain calculations
-                second_number = float(current)
+                second_number = self.display_value(current)
                 result = self.calculate(self.first_number, second_number, self.operator)
-                self.display_var.set(str(result))
+                self.show_result(result)
+                self.entry_digits = None
                 self.first_number = result
             
             self.operator = text
@@ -303,9 +465,10 @@ class FinanceCalculator:
             # Perform calculation
             if self.operator and self.first_number is not None:
                 try:
-                    second_number = float(current)
+                    second_number = self.display_value(current)
                     result = self.calculate(self.first_number, second_number, self.operator)
-                    self.display_var.set(str(result))
+                    self.show_result(result)
+                    self.entry_digits = None
                     self.first_number = None
                     self.operator = None
                     self.should_reset_display = True
@@ -314,35 +477,56 @@ class FinanceCalculator:
                     
         elif text == '±':
             # Toggle sign
-            try:
-                value = float(current)
-                self.display_var.set(str(-value))
-            except:
-                pass
+            if self.is_display_number(current):
+                value = -self.display_value(current)
+                self.show_result(value)
+                self.entry_digits = None
                 
         elif text == '%':
             # Percentage
-            try:
-                value = float(current)
-                self.display_var.set(str(value / 100))
-            except:
-                pass
+            if self.is_display_number(current):
+                value = self.display_value(current) / 100
+                self.show_result(value)
+                self.entry_digits = None
                 
         elif text == '.':
             # Decimal point
             if self.should_reset_display:
-                self.display_var.set("0.")
+                self.set_display_value("0.", 0.0)
+                self.entry_digits = 0
+                self.entry_decimals = 0
                 self.should_reset_display = False
+            elif self.entry_digits is not None and current == self.current_value_text:
+                # A typed entry already knows whether it has a decimal point
+                if self.entry_decimals is None:
+                    self.entry_decimals = 0
+                    self.set_display_value(current + '.', self.current_value)
             elif '.' not in current:
                 self.display_var.set(current + '.')
                 
         else:
             # Numbers
             if self.should_reset_display or current == "0":
-                self.display_var.set(text)
+                display = text
+                self.entry_digits = int(text)
+                self.entry_decimals = None
                 self.should_reset_display = False
             else:
-                self.display_var.set(current + text)
+                display = current + text
+                if self.entry_digits is not None and current == self.current_value_text:
+                    self.entry_digits = self.entry_digits * 10 + int(text)
+                    if self.entry_decimals is not None:
+                        self.entry_decimals += 1
+                else:
+                    self.entry_digits = None
+            
+            if self.entry_digits is None:
+                # Not a plain typed entry; parse lazily when the value is needed
+                self.display_var.set(display)
+            else:
+                # Integer division is correctly rounded, matching float(display)
+                value = self.entry_digits / 10 ** (self.entry_decimals or 0)
+                self.set_display_value(display, value)
     
     def handle_scientific_button_click(self, text, current):
         """Handle scientific calculator button clicks with improved expression handling"""
@@ -576,46 +760,117 @@ class FinanceCalculator:
     
     def calculate(self, first: float, second: float, operator: str) -> float:
         """Perform basic arithmetic calculations"""
-        if operator == '+':
-            return first + second
-        elif operator == '−':
-            return first - second
-        elif operator == '×':
-            return first * second
-        elif operator == '÷':
-            if second == 0:
-                raise ValueError("Division by zero")
-            return first / second
-        else:
-            return second
+        operation = _KEYPAD_OPERATIONS.get(operator)
+        if operation is None:
+            operation = _OPERATIONS.get(operator.translate(_OPERATOR_TABLE))
+        if operation is _operator.truediv and second == 0:
+            raise ValueError("Division by zero")
+        return operation(first, second) if operation else second
     
     def switch_mode(self, mode):
         """Switch between calculator modes"""
         self.current_mode = mode
-        if mode == "npv":
-            self.create_npv_interface()
-        elif mode == "dcf":
-            self.create_dcf_interface()
-        elif mode == "cashflow":
-            self.create_cashflow_interface()
-        elif mode == "bonds":
-            self.create_bonds_interface()
-        else:
+        builders = {
+            "npv": self.create_npv_interface,
+            "dcf": self.create_dcf_interface,
+            "cashflow": self.create_cashflow_interface,
+            "bonds": self.create_bonds_interface
+        }
+        if mode not in builders:
             self.create_basic_buttons()
+            return
+        
+        # Build each interface on first use, then just swap frames
+        self.clear_button_frame()
+        frame = self.mode_frames.get(mode)
+        if frame is None:
+            frame = builders[mode]()
+            self.mode_frames[mode] = frame
+        frame.pack(fill='both', expand=True)
+    
+    def create_scrollable_area(self, parent):
+        """Pack a vertically scrolling canvas into parent and return its inner frame"""
+        canvas = tk.Canvas(parent, bg='#1c1c1e', highlightthickness=0)
+        scrollbar = tk.Scrollbar(parent, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg='#1c1c1e')
+        
+        scrollable_frame.bind("<Configure>", self.on_scroll_frame_configure)
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        self.scroll_canvases.add(canvas)
+        
+        return scrollable_frame
+    
+    def on_scroll_frame_configure(self, event):
+        """Keep a scrollable area's scroll region in step with its inner frame"""
+        canvas = event.widget.master
+        canvas.configure(scrollregion=canvas.bbox("all"))
+    
+    def on_mouse_wheel(self, event):
+        """Scroll the scrollable area under the pointer, if there is one"""
+        widget = event.widget
+        if isinstance(widget, tk.Text):
+            return  # Text widgets scroll themselves
+        
+        while isinstance(widget, tk.Misc):
+            if widget in self.scroll_canvases:
+                # X11 reports wheel ticks as buttons 4/5, others as a delta
+                if event.num == 4:
+                    step = -1
+                elif event.num == 5:
+                    step = 1
+                else:
+                    step = -1 if event.delta > 0 else 1
+                widget.yview_scroll(step, "units")
+                return
+            widget = widget.master
+    
+    def create_form_fields(self, parent, fields, padx=10):
+        """
+        Grid labelled entry fields into a single frame
+        
+        Args:
+            parent: Widget to pack the form into
+            fields: List of (label, hint, default) tuples
+            padx: Horizontal padding around the form
+        
+        Returns:
+            List of the created Entry widgets, in field order
+        """
+        form = tk.Frame(parent, bg='#1c1c1e')
+        form.pack(fill='x', pady=5, padx=padx)
+        form.grid_columnconfigure(1, weight=1)
+        
+        entries = []
+        for row, (label, hint, default) in enumerate(fields):
+            label_frame = tk.Frame(form, bg='#1c1c1e')
+            label_frame.grid(row=row, column=0, pady=5)
+            tk.Label(label_frame, text=label, bg='#1c1c1e', fg='white').pack()
+            tk.Label(label_frame, text=hint, 
+                    font=('SF Pro Display', 8), bg='#1c1c1e', fg='#666666').pack()
+            
+            entry = tk.Entry(form, bg='#333333', fg='white', font=('SF Pro Display', 12))
+            entry.grid(row=row, column=1, sticky='ew', padx=(10, 0), pady=5)
+            entry.insert(0, default)
+            entries.append(entry)
+        
+        return entries
     
     def create_npv_interface(self):
         """Create NPV calculation interface"""
-        # Clear existing buttons
-        for widget in self.button_frame.winfo_children():
-            widget.destroy()
+        frame = tk.Frame(self.button_frame, bg='#1c1c1e')
         
         # NPV input fields
-        tk.Label(self.button_frame, text="NPV Calculator", 
+        tk.Label(frame, text="NPV Calculator", 
                 font=('SF Pro Display', 18), bg='#1c1c1e', fg='white').pack(pady=10)
         
         # Help text
         help_text = tk.Label(
-            self.button_frame, 
+            frame, 
             text="💡 Analyze investment profitability with Net Present Value, IRR, and Payback Period",
             font=('SF Pro Display', 10), 
             bg='#1c1c1e', 
@@ -624,36 +879,28 @@ class FinanceCalculator:
         )
         help_text.pack(pady=(0, 10))
         
-        # Discount rate input with tooltip
-        rate_frame = tk.Frame(self.button_frame, bg='#1c1c1e')
-        rate_frame.pack(fill='x', pady=5)
-        
-        rate_label_frame = tk.Frame(rate_frame, bg='#1c1c1e')
-        rate_label_frame.pack(side='left')
-        tk.Label(rate_label_frame, text="Discount Rate (%):", bg='#1c1c1e', fg='white').pack()
-        tk.Label(rate_label_frame, text="Required return rate", 
-                font=('SF Pro Display', 8), bg='#1c1c1e', fg='#666666').pack()
-        
-        self.rate_entry = tk.Entry(rate_frame, bg='#333333', fg='white', font=('SF Pro Display', 12))
-        self.rate_entry.pack(side='right', fill='x', expand=True, padx=(10, 0))
-        self.rate_entry.insert(0, "10")  # Default example
+        # Labelled input fields
+        self.rate_entry = self.create_form_fields(frame, [
+            ("Discount Rate (%):", "Required return rate", "10")
+        ], padx=0)[0]
         
         # Cash flows input with example
-        cashflow_label_frame = tk.Frame(self.button_frame, bg='#1c1c1e')
+        cashflow_label_frame = tk.Frame(frame, bg='#1c1c1e')
         cashflow_label_frame.pack(fill='x', pady=(10, 5))
         tk.Label(cashflow_label_frame, text="Cash Flows (comma separated):", 
                 bg='#1c1c1e', fg='white').pack(anchor='w')
         tk.Label(cashflow_label_frame, text="Example: -10000, 3000, 4000, 5000, 2000", 
                 font=('SF Pro Display', 9), bg='#1c1c1e', fg='#666666').pack(anchor='w')
         
-        self.cashflows_entry = tk.Text(self.button_frame, height=3, bg='#333333', fg='white', 
-                                     font=('SF Pro Display', 12))
+        # Single-line list, read through its StringVar without a Text round trip
+        self.cashflows_var = tk.StringVar(master=self.root, value="-10000, 3000, 4000, 5000, 2000")  # Default example
+        self.cashflows_entry = tk.Entry(frame, textvariable=self.cashflows_var, bg='#333333', fg='white', 
+                                      font=('SF Pro Display', 12))
         self.cashflows_entry.pack(fill='x', pady=5)
-        self.cashflows_entry.insert("1.0", "-10000, 3000, 4000, 5000, 2000")  # Default example
         
         # Input format help
         format_help = tk.Label(
-            self.button_frame,
+            frame,
             text="📝 First value: Initial investment (negative)\n📈 Following values: Future cash inflows (positive)",
             font=('SF Pro Display', 9),
             bg='#1c1c1e',
@@ -664,57 +911,46 @@ class FinanceCalculator:
         
         # Calculate button
         calc_btn = tk.Button(
-            self.button_frame,
+            frame,
             text="Calculate NPV Analysis",
             command=self.calculate_npv,
-            bg='#d4d4d2',
-            fg='#1c1c1e',
-            font=('SF Pro Display', 16),
-            relief='flat'
+            font=('SF Pro Display', 16)
         )
         calc_btn.pack(pady=10, fill='x')
+        
+        return frame
     
     def calculate_npv(self):
         """Calculate NPV from inputs with enhanced validation"""
+        from tkinter import messagebox
+        from finance_utils import FinancialCalculations
         try:
-            # Validate discount rate
-            rate_text = self.rate_entry.get().strip()
-            if not rate_text:
-                messagebox.showerror("Input Error", "Please enter a discount rate.\n\nExample: 10 (for 10%)")
-                return
+            errors, warnings = [], []
             
-            try:
-                rate = float(rate_text) / 100
+            # Validate discount rate
+            rate = self.read_percent(self.rate_entry, "discount rate", "10", errors)
+            if rate is not None:
                 if rate < 0:
-                    messagebox.showwarning("Input Warning", "Discount rate is negative. This is unusual but will proceed with calculation.")
+                    warnings.append("Discount rate is negative. This is unusual.")
                 elif rate > 1:
-                    messagebox.showwarning("Input Warning", f"Discount rate of {rate*100:.1f}% seems very high. Please verify this is correct.")
-            except ValueError:
-                messagebox.showerror("Input Error", f"Invalid discount rate: '{rate_text}'\n\nPlease enter a number (e.g., 10 for 10%)")
-                return
+                    warnings.append(f"Discount rate of {rate*100:.1f}% seems very high. Please verify this is correct.")
             
             # Validate cash flows
-            cashflows_text = self.cashflows_entry.get("1.0", tk.END).strip()
+            cashflows_text = self.cashflows_var.get().strip()
             if not cashflows_text:
-                messagebox.showerror("Input Error", "Please enter cash flows.\n\nExample: -10000, 3000, 4000, 5000, 2000")
-                return
-            
-            try:
-                cashflows = [float(x.strip()) for x in cashflows_text.split(',') if x.strip()]
-                if len(cashflows) < 2:
-                    messagebox.showerror("Input Error", "Please enter at least 2 cash flows.\n\nFirst: Initial investment (usually negative)\nFollowing: Future cash inflows")
-                    return
-                
-                # Check for typical investment pattern
-                if cashflows[0] > 0:
-                    result = messagebox.askyesno("Confirm Input", 
-                        f"First cash flow is positive (${cashflows[0]:,.2f}).\n\nTypically, the first value should be negative (initial investment).\n\nContinue anyway?")
-                    if not result:
-                        return
-                        
-            except ValueError as e:
-                messagebox.showerror("Input Error", 
-                    f"Invalid cash flow format.\n\nPlease use comma-separated numbers:\nExample: -10000, 3000, 4000, 5000, 2000\n\nError: {str(e)}")
+                errors.append("Please enter cash flows. Example: -10000, 3000, 4000, 5000, 2000")
+            else:
+                try:
+                    cashflows = parse_cashflows(cashflows_text)
+                    if cashflows.size < 2:
+                        errors.append("Please enter at least 2 cash flows: the initial investment (usually negative), then future cash inflows.")
+                    elif cashflows[0] > 0:
+                        # Check for typical investment pattern
+                        warnings.append(f"First cash flow is positive (${cashflows[0]:,.2f}). Typically, the first value should be negative (initial investment).")
+                except ValueError as e:
+                    errors.append(f"Invalid cash flow format: {e}. Please use comma-separated numbers, e.g. -10000, 3000, 4000, 5000, 2000")
+            
+            if not self.confirm_inputs(errors, warnings):
                 return
             
             # Perform calculations
@@ -722,38 +958,33 @@ class FinanceCalculator:
             irr = FinancialCalculations.irr(cashflows)
             payback = FinancialCalculations.payback_period(cashflows)
             
-            # Enhanced results display with interpretation
-            result_text = f"NPV: ${npv:,.2f}"
-            
-            # Add NPV interpretation
+            # Enhanced results display with interpretation, one line per metric
             if npv > 0:
-                result_text += " ✅ (Profitable)"
+                verdict = "✅ (Profitable)"
             elif npv < 0:
-                result_text += " ❌ (Not Profitable)"
+                verdict = "❌ (Not Profitable)"
             else:
-                result_text += " ⚖️ (Break-even)"
+                verdict = "⚖️ (Break-even)"
+            lines = [f"NPV: ${npv:,.2f} {verdict}"]
             
             if irr:
-                result_text += f"\nIRR: {irr:.2%}"
                 # Compare IRR to discount rate
-                if irr > rate:
-                    result_text += " ✅ (> Required Rate)"
-                else:
-                    result_text += " ❌ (< Required Rate)"
+                comparison = "✅ (> Required Rate)" if irr > rate else "❌ (< Required Rate)"
+                lines.append(f"IRR: {irr:.2%} {comparison}")
             else:
-                result_text += "\nIRR: Unable to calculate"
+                lines.append("IRR: Unable to calculate")
                 
             if payback:
-                result_text += f"\nPayback: {payback:.1f} years"
+                lines.append(f"Payback: {payback:.1f} years")
             else:
-                result_text += "\nPayback: Never pays back"
+                lines.append("Payback: Never pays back")
             
-            self.display_var.set(result_text)
+            self.display_var.set("\n".join(lines))
             
             # Save calculation data for export and history
             inputs_data = {
                 'discount_rate': rate * 100,  # Convert back to percentage
-                'cash_flows': cashflows
+                'cash_flows': cashflows.tolist()
             }
             results_data = {
                 'npv': npv,
@@ -763,18 +994,16 @@ class FinanceCalculator:
             self.save_calculation_data('npv', inputs_data, results_data)
             
             # Show success message with summary and export options
-            success_msg = (f"Analysis completed successfully!\n\n" +
-                f"Investment Summary:\n" +
-                f"• NPV: ${npv:,.2f} ({'Profitable' if npv > 0 else 'Not Profitable'})\n" +
-                f"• IRR: {irr:.2%} vs {rate:.2%} required\n" +
-                f"• Payback: {payback:.1f} years" if payback else "• Payback: Never pays back")
-            
-            result = messagebox.askquestion("NPV Analysis Complete", 
-                success_msg + "\n\nWould you like to export or save this calculation?",
-                icon='question')
+            success_msg = "\n".join([
+                "Analysis completed successfully!",
+                "",
+                "Investment Summary:",
+                f"• NPV: ${npv:,.2f} ({'Profitable' if npv > 0 else 'Not Profitable'})",
+                f"• IRR: {irr:.2%} vs {rate:.2%} required" if irr else "• IRR: Unable to calculate",
+                f"• Payback: {payback:.1f} years" if payback else "• Payback: Never pays back",
+            ])
             
-            if result == 'yes':
-                self.export_current_calculation()
+            self.offer_export("NPV Analysis Complete", success_msg)
             
         except Exception as e:
             messagebox.showerror("Calculation Error", 
@@ -782,29 +1011,15 @@ class FinanceCalculator:
     
     def create_dcf_interface(self):
         """Create DCF valuation interface"""
-        for widget in self.button_frame.winfo_children():
-            widget.destroy()
-        
-        # Create scrollable frame
-        canvas = tk.Canvas(self.button_frame, bg='#1c1c1e', highlightthickness=0)
-        scrollbar = tk.Scrollbar(self.button_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#1c1c1e')
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        frame = tk.Frame(self.button_frame, bg='#1c1c1e')
         
         # DCF input fields
-        tk.Label(scrollable_frame, text="DCF Valuation", 
+        tk.Label(frame, text="DCF Valuation", 
                 font=('SF Pro Display', 18), bg='#1c1c1e', fg='white').pack(pady=10)
         
         # Help text
         help_text = tk.Label(
-            scrollable_frame, 
+            frame, 
             text="🏢 Value a company using Discounted Cash Flow analysis with terminal value",
             font=('SF Pro Display', 10), 
             bg='#1c1c1e', 
@@ -814,127 +1029,79 @@ class FinanceCalculator:
         help_text.pack(pady=(0, 10), padx=10)
         
         # Free Cash Flows with example
-        fcf_label_frame = tk.Frame(scrollable_frame, bg='#1c1c1e')
+        fcf_label_frame = tk.Frame(frame, bg='#1c1c1e')
         fcf_label_frame.pack(fill='x', pady=(10, 5), padx=10)
         tk.Label(fcf_label_frame, text="Free Cash Flows (comma separated):", 
                 bg='#1c1c1e', fg='white').pack(anchor='w')
         tk.Label(fcf_label_frame, text="Example: 500, 550, 600, 650", 
                 font=('SF Pro Display', 9), bg='#1c1c1e', fg='#666666').pack(anchor='w')
         
-        self.dcf_cashflows_entry = tk.Text(scrollable_frame, height=3, bg='#333333', fg='white',
-                                         font=('SF Pro Display', 12))
+        self.dcf_cashflows_var = tk.StringVar(master=self.root, value="500, 550, 600, 650")  # Default example
+        self.dcf_cashflows_entry = tk.Entry(frame, textvariable=self.dcf_cashflows_var, bg='#333333', fg='white',
+                                          font=('SF Pro Display', 12))
         self.dcf_cashflows_entry.pack(fill='x', pady=5, padx=10)
-        self.dcf_cashflows_entry.insert("1.0", "500, 550, 600, 650")  # Default example
-        
-        # Terminal Growth Rate with tooltip
-        growth_frame = tk.Frame(scrollable_frame, bg='#1c1c1e')
-        growth_frame.pack(fill='x', pady=5, padx=10)
-        
-        growth_label_frame = tk.Frame(growth_frame, bg='#1c1c1e')
-        growth_label_frame.pack(side='left')
-        tk.Label(growth_label_frame, text="Terminal Growth Rate (%):", bg='#1c1c1e', fg='white').pack()
-        tk.Label(growth_label_frame, text="Long-term growth (2-4%)", 
-                font=('SF Pro Display', 8), bg='#1c1c1e', fg='#666666').pack()
-        
-        self.terminal_growth_entry = tk.Entry(growth_frame, bg='#333333', fg='white', 
-                                            font=('SF Pro Display', 12))
-        self.terminal_growth_entry.pack(side='right', fill='x', expand=True, padx=(10, 0))
-        self.terminal_growth_entry.insert(0, "2.5")  # Default example
-        
-        # Discount Rate (WACC) with tooltip
-        wacc_frame = tk.Frame(scrollable_frame, bg='#1c1c1e')
-        wacc_frame.pack(fill='x', pady=5, padx=10)
-        
-        wacc_label_frame = tk.Frame(wacc_frame, bg='#1c1c1e')
-        wacc_label_frame.pack(side='left')
-        tk.Label(wacc_label_frame, text="Discount Rate/WACC (%):", bg='#1c1c1e', fg='white').pack()
-        tk.Label(wacc_label_frame, text="Cost of capital", 
-                font=('SF Pro Display', 8), bg='#1c1c1e', fg='#666666').pack()
-        
-        self.wacc_entry = tk.Entry(wacc_frame, bg='#333333', fg='white', 
-                                 font=('SF Pro Display', 12))
-        self.wacc_entry.pack(side='right', fill='x', expand=True, padx=(10, 0))
-        self.wacc_entry.insert(0, "10")  # Default example
+        
+        # Labelled input fields
+        self.terminal_growth_entry, self.wacc_entry = self.create_form_fields(frame, [
+            ("Terminal Growth Rate (%):", "Long-term growth (2-4%)", "2.5"),
+            ("Discount Rate/WACC (%):", "Cost of capital", "10")
+        ])
         
         # Calculate button
         calc_btn = tk.Button(
-            scrollable_frame,
+            frame,
             text="Calculate DCF",
             command=self.calculate_dcf,
-            bg='#d4d4d2',
-            fg='#1c1c1e',
-            font=('SF Pro Display', 16),
-            relief='flat'
+            font=('SF Pro Display', 16)
         )
         calc_btn.pack(pady=10, fill='x', padx=10)
         
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        return frame
     
     def calculate_dcf(self):
         """Calculate DCF valuation from inputs with enhanced validation"""
+        from tkinter import messagebox
+        from finance_utils import FinancialCalculations
         try:
+            errors, warnings = [], []
+            
             # Validate free cash flows
-            cashflows_text = self.dcf_cashflows_entry.get("1.0", tk.END).strip()
+            cashflows_text = self.dcf_cashflows_var.get().strip()
             if not cashflows_text:
-                messagebox.showerror("Input Error", "Please enter free cash flows.\n\nExample: 500, 550, 600, 650")
-                return
-            
-            try:
-                cashflows = [float(x.strip()) for x in cashflows_text.split(',') if x.strip()]
-                if len(cashflows) < 2:
-                    messagebox.showerror("Input Error", "Please enter at least 2 years of cash flows for meaningful DCF analysis.")
-                    return
-                
-                # Check for negative cash flows (warning, not error)
-                negative_count = sum(1 for cf in cashflows if cf < 0)
-                if negative_count > 0:
-                    result = messagebox.askyesno("Confirm Input", 
-                        f"Found {negative_count} negative cash flow(s).\n\nDCF typically uses positive free cash flows.\n\nContinue anyway?")
-                    if not result:
-                        return
-                        
-            except ValueError as e:
-                messagebox.showerror("Input Error", 
-                    f"Invalid cash flow format.\n\nPlease use comma-separated numbers:\nExample: 500, 550, 600, 650\n\nError: {str(e)}")
-                return
+                errors.append("Please enter free cash flows. Example: 500, 550, 600, 650")
+            else:
+                try:
+                    cashflows = parse_cashflows(cashflows_text)
+                    if cashflows.size < 2:
+                        errors.append("Please enter at least 2 years of cash flows for meaningful DCF analysis.")
+                    
+                    # Negative cash flows are a warning, not an error
+                    negative_count = int((cashflows < 0).sum())
+                    if negative_count > 0:
+                        warnings.append(f"Found {negative_count} negative cash flow(s). DCF typically uses positive free cash flows.")
+                except ValueError as e:
+                    errors.append(f"Invalid cash flow format: {e}. Please use comma-separated numbers, e.g. 500, 550, 600, 650")
             
             # Validate terminal growth rate
-            terminal_text = self.terminal_growth_entry.get().strip()
-            if not terminal_text:
-                messagebox.showerror("Input Error", "Please enter terminal growth rate.\n\nTypical range: 2-4% for mature companies")
-                return
-            
-            try:
-                terminal_growth = float(terminal_text) / 100
+            terminal_growth = self.read_percent(self.terminal_growth_entry, "terminal growth rate", "2.5", errors)
+            if terminal_growth is not None:
                 if terminal_growth < 0:
-                    messagebox.showwarning("Input Warning", "Negative terminal growth rate. This implies declining business.")
+                    warnings.append("Negative terminal growth rate. This implies declining business.")
                 elif terminal_growth > 0.06:  # 6%
-                    messagebox.showwarning("Input Warning", f"Terminal growth of {terminal_growth*100:.1f}% is very high.\n\nTypical range is 2-4% for long-term growth.")
-            except ValueError:
-                messagebox.showerror("Input Error", f"Invalid terminal growth rate: '{terminal_text}'\n\nPlease enter a number (e.g., 2.5 for 2.5%)")
-                return
+                    warnings.append(f"Terminal growth of {terminal_growth*100:.1f}% is very high. Typical range is 2-4% for long-term growth.")
             
             # Validate discount rate (WACC)
-            wacc_text = self.wacc_entry.get().strip()
-            if not wacc_text:
-                messagebox.showerror("Input Error", "Please enter discount rate (WACC).\n\nExample: 10 (for 10%)")
-                return
-            
-            try:
-                discount_rate = float(wacc_text) / 100
+            discount_rate = self.read_percent(self.wacc_entry, "discount rate (WACC)", "10", errors)
+            if discount_rate is not None:
                 if discount_rate <= 0:
-                    messagebox.showerror("Input Error", "Discount rate must be positive.")
-                    return
-                elif discount_rate <= terminal_growth:
-                    messagebox.showerror("Input Error", 
-                        f"Discount rate ({discount_rate*100:.1f}%) must be higher than terminal growth ({terminal_growth*100:.1f}%).\n\nThis is required for terminal value calculation.")
-                    return
+                    errors.append("Discount rate must be positive.")
+                elif terminal_growth is not None and discount_rate <= terminal_growth:
+                    errors.append(f"Discount rate ({discount_rate*100:.1f}%) must be higher than terminal growth ({terminal_growth*100:.1f}%). "
+                                  "This is required for terminal value calculation.")
                 elif discount_rate > 0.5:  # 50%
-                    messagebox.showwarning("Input Warning", f"Discount rate of {discount_rate*100:.1f}% seems extremely high.")
-            except ValueError:
-                messagebox.showerror("Input Error", f"Invalid discount rate: '{wacc_text}'\n\nPlease enter a number (e.g., 10 for 10%)")
+                    warnings.append(f"Discount rate of {discount_rate*100:.1f}% seems extremely high.")
+            
+            if not self.confirm_inputs(errors, warnings):
                 return
             
             # Calculate DCF
@@ -942,26 +1109,26 @@ class FinanceCalculator:
                 cashflows, terminal_growth, discount_rate
             )
             
-            # Enhanced results display with interpretation
-            result_text = f"Enterprise Value: ${dcf_result['enterprise_value']:,.0f}"
-            
             # Add valuation insights
             terminal_percentage = (dcf_result['pv_terminal_value'] / dcf_result['enterprise_value']) * 100
             if terminal_percentage > 80:
-                result_text += f"\n⚠️ Terminal value: {terminal_percentage:.0f}% of total"
+                marker = "⚠️"
             elif terminal_percentage > 60:
-                result_text += f"\n📊 Terminal value: {terminal_percentage:.0f}% of total"
+                marker = "📊"
             else:
-                result_text += f"\n✅ Terminal value: {terminal_percentage:.0f}% of total"
-            
-            result_text += f"\nPV Cash Flows: ${dcf_result['pv_cashflows']:,.0f}"
-            result_text += f"\nPV Terminal: ${dcf_result['pv_terminal_value']:,.0f}"
+                marker = "✅"
             
-            self.display_var.set(result_text)
+            # Enhanced results display with interpretation, one line per metric
+            self.display_var.set("\n".join([
+                f"Enterprise Value: ${dcf_result['enterprise_value']:,.0f}",
+                f"{marker} Terminal value: {terminal_percentage:.0f}% of total",
+                f"PV Cash Flows: ${dcf_result['pv_cashflows']:,.0f}",
+                f"PV Terminal: ${dcf_result['pv_terminal_value']:,.0f}",
+            ]))
             
             # Save calculation data for export and history
             inputs_data = {
-                'cash_flows': cashflows,
+                'cash_flows': cashflows.tolist(),
                 'terminal_growth': terminal_growth * 100,  # Convert back to percentage
                 'discount_rate': discount_rate * 100  # Convert back to percentage
             }
@@ -974,19 +1141,17 @@ class FinanceCalculator:
             self.save_calculation_data('dcf', inputs_data, results_data)
             
             # Show success message with detailed breakdown and export options
-            success_msg = (f"Enterprise valuation completed!\n\n" +
-                f"Valuation Summary:\n" +
-                f"• Enterprise Value: ${dcf_result['enterprise_value']:,.0f}\n" +
-                f"• PV of Cash Flows: ${dcf_result['pv_cashflows']:,.0f} ({100-terminal_percentage:.0f}%)\n" +
-                f"• PV of Terminal Value: ${dcf_result['pv_terminal_value']:,.0f} ({terminal_percentage:.0f}%)\n" +
-                f"• Terminal Value: ${dcf_result['terminal_value']:,.0f}")
-            
-            result = messagebox.askquestion("DCF Valuation Complete", 
-                success_msg + "\n\nWould you like to export or save this calculation?",
-                icon='question')
-            
-            if result == 'yes':
-                self.export_current_calculation()
+            success_msg = "\n".join([
+                "Enterprise valuation completed!",
+                "",
+                "Valuation Summary:",
+                f"• Enterprise Value: ${dcf_result['enterprise_value']:,.0f}",
+                f"• PV of Cash Flows: ${dcf_result['pv_cashflows']:,.0f} ({100-terminal_percentage:.0f}%)",
+                f"• PV of Terminal Value: ${dcf_result['pv_terminal_value']:,.0f} ({terminal_percentage:.0f}%)",
+                f"• Terminal Value: ${dcf_result['terminal_value']:,.0f}",
+            ])
+            
+            self.offer_export("DCF Valuation Complete", success_msg)
             
         except Exception as e:
             messagebox.showerror("Calculation Error", 
@@ -994,21 +1159,10 @@ class FinanceCalculator:
     
     def create_cashflow_interface(self):
         """Create cash flow projection interface"""
-        for widget in self.button_frame.winfo_children():
-            widget.destroy()
+        frame = tk.Frame(self.button_frame, bg='#1c1c1e')
         
         # Create scrollable frame
-        canvas = tk.Canvas(self.button_frame, bg='#1c1c1e', highlightthickness=0)
-        scrollbar = tk.Scrollbar(self.button_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#1c1c1e')
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollable_frame = self.create_scrollable_area(frame)
         
         # Cash Flow Projection inputs
         tk.Label(scrollable_frame, text="Cash Flow Projections", 
@@ -1025,60 +1179,19 @@ class FinanceCalculator:
         )
         help_text.pack(pady=(0, 10), padx=10)
         
-        # Initial Cash Flow with tooltip
-        initial_frame = tk.Frame(scrollable_frame, bg='#1c1c1e')
-        initial_frame.pack(fill='x', pady=5, padx=10)
-        
-        initial_label_frame = tk.Frame(initial_frame, bg='#1c1c1e')
-        initial_label_frame.pack(side='left')
-        tk.Label(initial_label_frame, text="Initial Cash Flow ($):", bg='#1c1c1e', fg='white').pack()
-        tk.Label(initial_label_frame, text="Starting year cash flow", 
-                font=('SF Pro Display', 8), bg='#1c1c1e', fg='#666666').pack()
-        
-        self.initial_cf_entry = tk.Entry(initial_frame, bg='#333333', fg='white', 
-                                       font=('SF Pro Display', 12))
-        self.initial_cf_entry.pack(side='right', fill='x', expand=True, padx=(10, 0))
-        self.initial_cf_entry.insert(0, "100000")  # Default example
-        
-        # Growth Rate with tooltip
-        growth_cf_frame = tk.Frame(scrollable_frame, bg='#1c1c1e')
-        growth_cf_frame.pack(fill='x', pady=5, padx=10)
-        
-        growth_cf_label_frame = tk.Frame(growth_cf_frame, bg='#1c1c1e')
-        growth_cf_label_frame.pack(side='left')
-        tk.Label(growth_cf_label_frame, text="Annual Growth Rate (%):", bg='#1c1c1e', fg='white').pack()
-        tk.Label(growth_cf_label_frame, text="Yearly increase rate", 
-                font=('SF Pro Display', 8), bg='#1c1c1e', fg='#666666').pack()
-        
-        self.growth_cf_entry = tk.Entry(growth_cf_frame, bg='#333333', fg='white', 
-                                      font=('SF Pro Display', 12))
-        self.growth_cf_entry.pack(side='right', fill='x', expand=True, padx=(10, 0))
-        self.growth_cf_entry.insert(0, "8")  # Default example
-        
-        # Number of Years with tooltip
-        years_frame = tk.Frame(scrollable_frame, bg='#1c1c1e')
-        years_frame.pack(fill='x', pady=5, padx=10)
-        
-        years_label_frame = tk.Frame(years_frame, bg='#1c1c1e')
-        years_label_frame.pack(side='left')
-        tk.Label(years_label_frame, text="Number of Years:", bg='#1c1c1e', fg='white').pack()
-        tk.Label(years_label_frame, text="Projection period", 
-                font=('SF Pro Display', 8), bg='#1c1c1e', fg='#666666').pack()
-        
-        self.years_entry = tk.Entry(years_frame, bg='#333333', fg='white', 
-                                  font=('SF Pro Display', 12))
-        self.years_entry.pack(side='right', fill='x', expand=True, padx=(10, 0))
-        self.years_entry.insert(0, "5")  # Default example
+        # Labelled input fields
+        self.initial_cf_entry, self.growth_cf_entry, self.years_entry = self.create_form_fields(scrollable_frame, [
+            ("Initial Cash Flow ($):", "Starting year cash flow", "100000"),
+            ("Annual Growth Rate (%):", "Yearly increase rate", "8"),
+            ("Number of Years:", "Projection period", "5")
+        ])
         
         # Calculate button
         calc_btn = tk.Button(
             scrollable_frame,
             text="Project Cash Flows",
             command=self.calculate_cashflow_projection,
-            bg='#d4d4d2',
-            fg='#1c1c1e',
-            font=('SF Pro Display', 16),
-            relief='flat'
+            font=('SF Pro Display', 16)
         )
         calc_btn.pack(pady=10, fill='x', padx=10)
         
@@ -1092,112 +1205,91 @@ class FinanceCalculator:
         )
         self.cashflow_results.pack(fill='both', expand=True, pady=10, padx=10)
         
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        return frame
     
     def calculate_cashflow_projection(self):
         """Calculate and display cash flow projections with enhanced validation"""
+        from tkinter import messagebox
         try:
-            # Validate initial cash flow
-            initial_text = self.initial_cf_entry.get().strip()
-            if not initial_text:
-                messagebox.showerror("Input Error", "Please enter initial cash flow.\n\nExample: 100000")
-                return
+            errors, warnings = [], []
             
-            try:
-                initial_cf = float(initial_text)
-                if initial_cf == 0:
-                    messagebox.showerror("Input Error", "Initial cash flow cannot be zero.")
-                    return
-                elif initial_cf < 0:
-                    result = messagebox.askyesno("Confirm Input", 
-                        f"Initial cash flow is negative (${initial_cf:,.2f}).\n\nThis will project declining cash flows.\n\nContinue anyway?")
-                    if not result:
-                        return
-            except ValueError:
-                messagebox.showerror("Input Error", f"Invalid initial cash flow: '{initial_text}'\n\nPlease enter a number (e.g., 100000)")
-                return
+            # Validate initial cash flow
+            initial_cf = self.read_number(self.initial_cf_entry, "initial cash flow", "100000", errors)
+            if initial_cf == 0:
+                errors.append("Initial cash flow cannot be zero.")
+            elif initial_cf is not None and initial_cf < 0:
+                warnings.append(f"Initial cash flow is negative (${initial_cf:,.2f}). This will project declining cash flows.")
             
             # Validate growth rate
-            growth_text = self.growth_cf_entry.get().strip()
-            if not growth_text:
-                messagebox.showerror("Input Error", "Please enter growth rate.\n\nExample: 8 (for 8%)")
-                return
-            
-            try:
-                growth_rate = float(growth_text) / 100
+            growth_rate = self.read_percent(self.growth_cf_entry, "growth rate", "8", errors)
+            if growth_rate is not None:
                 if growth_rate < -0.5:  # -50%
-                    messagebox.showwarning("Input Warning", f"Growth rate of {growth_rate*100:.1f}% is very negative.\n\nThis implies rapid decline.")
+                    warnings.append(f"Growth rate of {growth_rate*100:.1f}% is very negative. This implies rapid decline.")
                 elif growth_rate > 0.5:  # 50%
-                    messagebox.showwarning("Input Warning", f"Growth rate of {growth_rate*100:.1f}% is extremely high.\n\nPlease verify this is realistic.")
-            except ValueError:
-                messagebox.showerror("Input Error", f"Invalid growth rate: '{growth_text}'\n\nPlease enter a number (e.g., 8 for 8%)")
-                return
+                    warnings.append(f"Growth rate of {growth_rate*100:.1f}% is extremely high. Please verify this is realistic.")
             
             # Validate number of years
-            years_text = self.years_entry.get().strip()
-            if not years_text:
-                messagebox.showerror("Input Error", "Please enter number of years.\n\nExample: 5")
-                return
-            
-            try:
-                years = int(float(years_text))  # Allow decimal input but convert to int
+            years = self.read_number(self.years_entry, "number of years", "5", errors)
+            if years is not None:
+                years = int(years)  # Allow decimal input but convert to int
                 if years <= 0:
-                    messagebox.showerror("Input Error", "Number of years must be positive.")
-                    return
+                    errors.append("Number of years must be positive.")
                 elif years > 50:
-                    result = messagebox.askyesno("Confirm Input", 
-                        f"Projecting {years} years is very long-term.\n\nLong-term projections become less reliable.\n\nContinue anyway?")
-                    if not result:
-                        return
-            except ValueError:
-                messagebox.showerror("Input Error", f"Invalid number of years: '{years_text}'\n\nPlease enter a whole number (e.g., 5)")
+                    warnings.append(f"Projecting {years} years is very long-term. Long-term projections become less reliable.")
+            
+            if not self.confirm_inputs(errors, warnings):
                 return
             
-            # Generate cash flow projections
-            projections = []
-            for year in range(1, years + 1):
-                cf = initial_cf * (1 + growth_rate) ** year
-                projections.append((year, cf))
+            # Generate cash flow projections in one vectorized power/multiply
+            import numpy as np
+            years_arr = np.arange(1, years + 1, dtype=np.float64)
+            growth_factors = np.power(1.0 + growth_rate, years_arr)
+            cfs = initial_cf * growth_factors
+            final_cf = float(cfs[-1])
             
-            # Calculate summary metrics
-            total_cf = sum(cf for _, cf in projections)
+            # Calculate summary metrics from the projected cash flows
+            total_cf = float(cfs.sum())
             avg_cf = total_cf / years
-            cagr = FinancialCalculations.compound_annual_growth_rate(
-                initial_cf, projections[-1][1], years
-            )
+            # Growth is constant, so the CAGR is exactly the growth rate
+            cagr = growth_rate
+            
+            # Growth analysis
+            total_growth = (float(growth_factors[-1]) - 1) * 100
+            
+            # Build the whole report first so the Text widget is updated once
+            lines = [
+                "CASH FLOW PROJECTIONS",
+                "=" * 35,
+                "",
+                # Show input parameters
+                "📊 Parameters:",
+                f"Initial CF: ${initial_cf:,.0f}",
+                f"Growth Rate: {growth_rate:.1%}",
+                f"Years: {years}",
+                "",
+                # Year-by-year projections
+                "📈 Yearly Projections:",
+            ]
+            growth_from_initial = (growth_factors - 1.0) * 100
+            lines.extend(map(_fmt_projection_line, range(1, years + 1),
+                             cfs.tolist(), growth_from_initial.tolist()))
+            lines.extend([
+                # Summary metrics
+                "",
+                "📋 Summary:",
+                f"Total Cash Flow: ${total_cf:,.0f}",
+                f"Average Annual CF: ${avg_cf:,.0f}",
+                f"CAGR: {cagr:.2%}",
+                f"Final Year CF: ${final_cf:,.0f}",
+                f"Total Growth: {total_growth:.0f}%",
+            ])
             
             # Display results with enhanced formatting
             self.cashflow_results.delete(1.0, tk.END)
-            self.cashflow_results.insert(tk.END, "CASH FLOW PROJECTIONS\n")
-            self.cashflow_results.insert(tk.END, "=" * 35 + "\n\n")
-            
-            # Show input parameters
-            self.cashflow_results.insert(tk.END, f"📊 Parameters:\n")
-            self.cashflow_results.insert(tk.END, f"Initial CF: ${initial_cf:,.0f}\n")
-            self.cashflow_results.insert(tk.END, f"Growth Rate: {growth_rate:.1%}\n")
-            self.cashflow_results.insert(tk.END, f"Years: {years}\n\n")
-            
-            # Year-by-year projections
-            self.cashflow_results.insert(tk.END, f"📈 Yearly Projections:\n")
-            for year, cf in projections:
-                growth_from_initial = ((cf / initial_cf) - 1) * 100
-                self.cashflow_results.insert(tk.END, f"Year {year}: ${cf:,.0f} (+{growth_from_initial:.0f}%)\n")
-            
-            # Summary metrics
-            self.cashflow_results.insert(tk.END, f"\n📋 Summary:\n")
-            self.cashflow_results.insert(tk.END, f"Total Cash Flow: ${total_cf:,.0f}\n")
-            self.cashflow_results.insert(tk.END, f"Average Annual CF: ${avg_cf:,.0f}\n")
-            self.cashflow_results.insert(tk.END, f"CAGR: {cagr:.2%}\n")
-            self.cashflow_results.insert(tk.END, f"Final Year CF: ${projections[-1][1]:,.0f}\n")
-            
-            # Growth analysis
-            total_growth = ((projections[-1][1] / initial_cf) - 1) * 100
-            self.cashflow_results.insert(tk.END, f"Total Growth: {total_growth:.0f}%\n")
+            self.cashflow_results.insert(tk.END, "\n".join(lines) + "\n")
             
             # Update main display with summary
-            self.display_var.set(f"Total: ${total_cf:,.0f}\nCAGR: {cagr:.2%}\nFinal: ${projections[-1][1]:,.0f}")
+            self.display_var.set(f"Total: ${total_cf:,.0f}\nCAGR: {cagr:.2%}\nFinal: ${final_cf:,.0f}")
             
             # Save calculation data for export and history
             inputs_data = {
@@ -1206,7 +1298,7 @@ class FinanceCalculator:
                 'years': years
             }
             results_data = {
-                'projections': [cf for _, cf in projections],
+                'projections': cfs.tolist(),
                 'total_cf': total_cf,
                 'avg_cf': avg_cf,
                 'cagr': cagr
@@ -1214,19 +1306,17 @@ class FinanceCalculator:
             self.save_calculation_data('cashflow', inputs_data, results_data)
             
             # Show success message with export option
-            success_msg = (f"Projection completed successfully!\n\n" +
-                f"Summary:\n" +
-                f"• Total {years}-year cash flow: ${total_cf:,.0f}\n" +
-                f"• Average annual: ${avg_cf:,.0f}\n" +
-                f"• CAGR: {cagr:.2%}\n" +
-                f"• Final year: ${projections[-1][1]:,.0f}")
-            
-            result = messagebox.askquestion("Cash Flow Projection Complete", 
-                success_msg + "\n\nWould you like to export or save this calculation?",
-                icon='question')
-            
-            if result == 'yes':
-                self.export_current_calculation()
+            success_msg = "\n".join([
+                "Projection completed successfully!",
+                "",
+                "Summary:",
+                f"• Total {years}-year cash flow: ${total_cf:,.0f}",
+                f"• Average annual: ${avg_cf:,.0f}",
+                f"• CAGR: {cagr:.2%}",
+                f"• Final year: ${final_cf:,.0f}",
+            ])
+            
+            self.offer_export("Cash Flow Projection Complete", success_msg)
             
         except Exception as e:
             messagebox.showerror("Calculation Error", 
@@ -1234,21 +1324,10 @@ class FinanceCalculator:
     
     def create_bonds_interface(self):
         """Create bond valuation interface"""
-        for widget in self.button_frame.winfo_children():
-            widget.destroy()
+        frame = tk.Frame(self.button_frame, bg='#1c1c1e')
         
         # Create scrollable frame
-        canvas = tk.Canvas(self.button_frame, bg='#1c1c1e', highlightthickness=0)
-        scrollbar = tk.Scrollbar(self.button_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#1c1c1e')
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollable_frame = self.create_scrollable_area(frame)
         
         # Bond Valuation inputs
         tk.Label(scrollable_frame, text="Bond Valuation", 
@@ -1265,80 +1344,16 @@ class FinanceCalculator:
         )
         help_text.pack(pady=(0, 10), padx=10)
         
-        # Face Value with tooltip
-        face_frame = tk.Frame(scrollable_frame, bg='#1c1c1e')
-        face_frame.pack(fill='x', pady=5, padx=10)
-        
-        face_label_frame = tk.Frame(face_frame, bg='#1c1c1e')
-        face_label_frame.pack(side='left')
-        tk.Label(face_label_frame, text="Face Value ($):", bg='#1c1c1e', fg='white').pack()
-        tk.Label(face_label_frame, text="Par value at maturity", 
-                font=('SF Pro Display', 8), bg='#1c1c1e', fg='#666666').pack()
-        
-        self.face_value_entry = tk.Entry(face_frame, bg='#333333', fg='white', 
-                                       font=('SF Pro Display', 12))
-        self.face_value_entry.pack(side='right', fill='x', expand=True, padx=(10, 0))
-        self.face_value_entry.insert(0, "1000")  # Default value
-        
-        # Coupon Rate with tooltip
-        coupon_frame = tk.Frame(scrollable_frame, bg='#1c1c1e')
-        coupon_frame.pack(fill='x', pady=5, padx=10)
-        
-        coupon_label_frame = tk.Frame(coupon_frame, bg='#1c1c1e')
-        coupon_label_frame.pack(side='left')
-        tk.Label(coupon_label_frame, text="Coupon Rate (%):", bg='#1c1c1e', fg='white').pack()
-        tk.Label(coupon_label_frame, text="Annual interest rate", 
-                font=('SF Pro Display', 8), bg='#1c1c1e', fg='#666666').pack()
-        
-        self.coupon_rate_entry = tk.Entry(coupon_frame, bg='#333333', fg='white', 
-                                        font=('SF Pro Display', 12))
-        self.coupon_rate_entry.pack(side='right', fill='x', expand=True, padx=(10, 0))
-        self.coupon_rate_entry.insert(0, "5.0")  # Default value
-        
-        # Yield Rate with tooltip
-        yield_frame = tk.Frame(scrollable_frame, bg='#1c1c1e')
-        yield_frame.pack(fill='x', pady=5, padx=10)
-        
-        yield_label_frame = tk.Frame(yield_frame, bg='#1c1c1e')
-        yield_label_frame.pack(side='left')
-        tk.Label(yield_label_frame, text="Required Yield (%):", bg='#1c1c1e', fg='white').pack()
-        tk.Label(yield_label_frame, text="Market discount rate", 
-                font=('SF Pro Display', 8), bg='#1c1c1e', fg='#666666').pack()
-        
-        self.yield_rate_entry = tk.Entry(yield_frame, bg='#333333', fg='white', 
-                                       font=('SF Pro Display', 12))
-        self.yield_rate_entry.pack(side='right', fill='x', expand=True, padx=(10, 0))
-        self.yield_rate_entry.insert(0, "6.0")  # Default value
-        
-        # Years to Maturity with tooltip
-        maturity_frame = tk.Frame(scrollable_frame, bg='#1c1c1e')
-        maturity_frame.pack(fill='x', pady=5, padx=10)
-        
-        maturity_label_frame = tk.Frame(maturity_frame, bg='#1c1c1e')
-        maturity_label_frame.pack(side='left')
-        tk.Label(maturity_label_frame, text="Years to Maturity:", bg='#1c1c1e', fg='white').pack()
-        tk.Label(maturity_label_frame, text="Time until bond expires", 
-                font=('SF Pro Display', 8), bg='#1c1c1e', fg='#666666').pack()
-        
-        self.maturity_entry = tk.Entry(maturity_frame, bg='#333333', fg='white', 
-                                     font=('SF Pro Display', 12))
-        self.maturity_entry.pack(side='right', fill='x', expand=True, padx=(10, 0))
-        self.maturity_entry.insert(0, "10")  # Default value
-        
-        # Payment Frequency with tooltip
-        freq_frame = tk.Frame(scrollable_frame, bg='#1c1c1e')
-        freq_frame.pack(fill='x', pady=5, padx=10)
-        
-        freq_label_frame = tk.Frame(freq_frame, bg='#1c1c1e')
-        freq_label_frame.pack(side='left')
-        tk.Label(freq_label_frame, text="Payments per Year:", bg='#1c1c1e', fg='white').pack()
-        tk.Label(freq_label_frame, text="2=semi-annual, 1=annual", 
-                font=('SF Pro Display', 8), bg='#1c1c1e', fg='#666666').pack()
-        
-        self.payment_freq_entry = tk.Entry(freq_frame, bg='#333333', fg='white', 
-                                         font=('SF Pro Display', 12))
-        self.payment_freq_entry.pack(side='right', fill='x', expand=True, padx=(10, 0))
-        self.payment_freq_entry.insert(0, "2")  # Default semi-annual
+        # Labelled input fields
+        (self.face_value_entry, self.coupon_rate_entry, self.yield_rate_entry, self.maturity_entry,
+         self.payment_freq_entry, self.market_price_entry) = self.create_form_fields(scrollable_frame, [
+            ("Face Value ($):", "Par value at maturity", "1000"),
+            ("Coupon Rate (%):", "Annual interest rate", "5.0"),
+            ("Required Yield (%):", "Market discount rate", "6.0"),
+            ("Years to Maturity:", "Time until bond expires", "10"),
+            ("Payments per Year:", "2=semi-annual, 1=annual", "2"),
+            ("Market Price ($):", "Current price, for YTM", "1000")
+        ])
         
         # Calculate buttons
         button_frame = tk.Frame(scrollable_frame, bg='#1c1c1e')
@@ -1348,10 +1363,7 @@ class FinanceCalculator:
             button_frame,
             text="Calculate Bond Price",
             command=self.calculate_bond_price,
-            bg='#d4d4d2',
-            fg='#1c1c1e',
-            font=('SF Pro Display', 14),
-            relief='flat'
+            font=('SF Pro Display', 14)
         )
         price_btn.pack(side='left', fill='x', expand=True, padx=(0, 5))
         
@@ -1359,10 +1371,7 @@ class FinanceCalculator:
             button_frame,
             text="Calculate YTM",
             command=self.calculate_ytm,
-            bg='#d4d4d2',
-            fg='#1c1c1e',
-            font=('SF Pro Display', 14),
-            relief='flat'
+            font=('SF Pro Display', 14)
         )
         ytm_btn.pack(side='right', fill='x', expand=True, padx=(5, 0))
         
@@ -1376,36 +1385,21 @@ class FinanceCalculator:
         )
         self.bond_results.pack(fill='both', expand=True, pady=10, padx=10)
         
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        return frame
     
     def calculate_bond_price(self):
         """Calculate bond price and related metrics"""
+        from tkinter import messagebox
+        from finance_utils import FinancialCalculations
         try:
-            face_value = float(self.face_value_entry.get())
-            coupon_rate = float(self.coupon_rate_entry.get()) / 100
+            face_value, coupon_rate, years_to_maturity, payments_per_year = self.read_bond_terms()
             yield_rate = float(self.yield_rate_entry.get()) / 100
-            years_to_maturity = int(self.maturity_entry.get())
-            payments_per_year = int(self.payment_freq_entry.get())
             
             # Calculate bond metrics
             bond_result = FinancialCalculations.bond_price(
                 face_value, coupon_rate, yield_rate, years_to_maturity, payments_per_year
             )
             
-            # Display results
-            self.bond_results.delete(1.0, tk.END)
-            self.bond_results.insert(tk.END, "BOND VALUATION RESULTS\n")
-            self.bond_results.insert(tk.END, "=" * 30 + "\n\n")
-            
-            self.bond_results.insert(tk.END, f"Bond Price: ${bond_result['bond_price']:,.2f}\n")
-            self.bond_results.insert(tk.END, f"PV of Coupons: ${bond_result['pv_coupons']:,.2f}\n")
-            self.bond_results.insert(tk.END, f"PV of Face Value: ${bond_result['pv_face_value']:,.2f}\n")
-            self.bond_results.insert(tk.END, f"Annual Coupon: ${bond_result['coupon_payment']:,.2f}\n")
-            self.bond_results.insert(tk.END, f"Current Yield: {bond_result['current_yield']:.2%}\n")
-            self.bond_results.insert(tk.END, f"Duration: {bond_result['duration']:.2f} years\n")
-            
             # Determine if bond is at premium, discount, or par
             if bond_result['bond_price'] > face_value:
                 status = "Premium"
@@ -1414,7 +1408,22 @@ class FinanceCalculator:
             else:
                 status = "Par"
             
-            self.bond_results.insert(tk.END, f"\nBond Status: Trading at {status}\n")
+            # Display results with a single insert
+            report = "\n".join([
+                "BOND VALUATION RESULTS",
+                "=" * 30,
+                "",
+                f"Bond Price: ${bond_result['bond_price']:,.2f}",
+                f"PV of Coupons: ${bond_result['pv_coupons']:,.2f}",
+                f"PV of Face Value: ${bond_result['pv_face_value']:,.2f}",
+                f"Annual Coupon: ${bond_result['coupon_payment']:,.2f}",
+                f"Current Yield: {bond_result['current_yield']:.2%}",
+                f"Duration: {bond_result['duration']:.2f} years",
+                "",
+                f"Bond Status: Trading at {status}",
+            ])
+            self.bond_results.delete(1.0, tk.END)
+            self.bond_results.insert(tk.END, report + "\n")
             
             # Save calculation data for export and history
             inputs_data = {
@@ -1436,19 +1445,17 @@ class FinanceCalculator:
             self.display_var.set(f"Price: ${bond_result['bond_price']:,.2f}\nYield: {bond_result['current_yield']:.2%}")
             
             # Show success message with export option
-            success_msg = (f"Bond valuation completed!\n\n" +
-                f"Bond Analysis:\n" +
-                f"• Bond Price: ${bond_result['bond_price']:,.2f}\n" +
-                f"• Current Yield: {bond_result['current_yield']:.2%}\n" +
-                f"• Duration: {bond_result['duration']:.2f} years\n" +
-                f"• Status: Trading at {status}")
-            
-            result = messagebox.askquestion("Bond Valuation Complete", 
-                success_msg + "\n\nWould you like to export or save this calculation?",
-                icon='question')
-            
-            if result == 'yes':
-                self.export_current_calculation()
+            success_msg = "\n".join([
+                "Bond valuation completed!",
+                "",
+                "Bond Analysis:",
+                f"• Bond Price: ${bond_result['bond_price']:,.2f}",
+                f"• Current Yield: {bond_result['current_yield']:.2%}",
+                f"• Duration: {bond_result['duration']:.2f} years",
+                f"• Status: Trading at {status}",
+            ])
+            
+            self.offer_export("Bond Valuation Complete", success_msg)
             
         except ValueError:
             messagebox.showerror("Error", "Please enter valid numbers")
@@ -1457,60 +1464,107 @@ class FinanceCalculator:
     
     def calculate_ytm(self):
         """Calculate yield to maturity"""
+        from tkinter import messagebox
+        from finance_utils import FinancialCalculations
         try:
-            # For YTM calculation, we need the current market price
-            # Let's use a simple input dialog for this
-            market_price = tk.simpledialog.askfloat(
-                "Market Price", 
-                "Enter current market price of the bond:",
-                minvalue=0.01
-            )
+            face_value, coupon_rate, years_to_maturity, payments_per_year = self.read_bond_terms()
             
-            if market_price is None:
+            # For YTM calculation, we need the current market price
+            market_price = float(self.market_price_entry.get())
+            if market_price <= 0:
+                messagebox.showerror("Input Error", "Market price must be positive.")
                 return
             
-            face_value = float(self.face_value_entry.get())
-            coupon_rate = float(self.coupon_rate_entry.get()) / 100
-            years_to_maturity = int(self.maturity_entry.get())
-            payments_per_year = int(self.payment_freq_entry.get())
-            
             # Calculate YTM
             ytm = FinancialCalculations.yield_to_maturity(
                 market_price, face_value, coupon_rate, years_to_maturity, payments_per_year
             )
             
-            # Display results
-            self.bond_results.delete(1.0, tk.END)
-            self.bond_results.insert(tk.END, "YIELD TO MATURITY CALCULATION\n")
-            self.bond_results.insert(tk.END, "=" * 30 + "\n\n")
-            
-            self.bond_results.insert(tk.END, f"Market Price: ${market_price:,.2f}\n")
-            self.bond_results.insert(tk.END, f"Face Value: ${face_value:,.2f}\n")
-            self.bond_results.insert(tk.END, f"Coupon Rate: {coupon_rate:.2%}\n")
-            self.bond_results.insert(tk.END, f"Years to Maturity: {years_to_maturity}\n")
+            lines = [
+                "YIELD TO MATURITY CALCULATION",
+                "=" * 30,
+                "",
+                f"Market Price: ${market_price:,.2f}",
+                f"Face Value: ${face_value:,.2f}",
+                f"Coupon Rate: {coupon_rate:.2%}",
+                f"Years to Maturity: {years_to_maturity}",
+                "",
+            ]
             
             if ytm:
-                self.bond_results.insert(tk.END, f"\nYield to Maturity: {ytm:.2%}\n")
+                lines.append(f"Yield to Maturity: {ytm:.2%}")
                 
                 # Compare to coupon rate
                 if ytm > coupon_rate:
-                    self.bond_results.insert(tk.END, "Bond is trading at a discount\n")
+                    lines.append("Bond is trading at a discount")
                 elif ytm < coupon_rate:
-                    self.bond_results.insert(tk.END, "Bond is trading at a premium\n")
+                    lines.append("Bond is trading at a premium")
                 else:
-                    self.bond_results.insert(tk.END, "Bond is trading at par\n")
+                    lines.append("Bond is trading at par")
                 
                 # Update main display
                 self.display_var.set(f"YTM: {ytm:.2%}")
             else:
-                self.bond_results.insert(tk.END, "\nYTM calculation failed\n")
+                lines.append("YTM calculation failed")
                 self.display_var.set("YTM: Error")
             
+            # Display results with a single insert
+            self.bond_results.delete(1.0, tk.END)
+            self.bond_results.insert(tk.END, "\n".join(lines) + "\n")
+            
         except ValueError:
             messagebox.showerror("Error", "Please enter valid numbers")
         except Exception as e:
             messagebox.showerror("Error", f"Calculation error: {str(e)}")
     
+    def read_bond_terms(self):
+        """Parse the bond terms shared by pricing and YTM (raises ValueError)"""
+        face_value = float(self.face_value_entry.get())
+        coupon_rate = float(self.coupon_rate_entry.get()) / 100
+        years_to_maturity = int(self.maturity_entry.get())
+        payments_per_year = int(self.payment_freq_entry.get())
+        return face_value, coupon_rate, years_to_maturity, payments_per_year
+    
+    def read_number(self, entry, name, example, errors):
+        """Parse a numeric entry, noting a missing or invalid value in errors"""
+        text = entry.get().strip()
+        if not text:
+            errors.append(f"Please enter {name}. Example: {example}")
+            return None
+        try:
+            return float(text)
+        except ValueError:
+            errors.append(f"Invalid {name}: '{text}'. Please enter a number (e.g., {example})")
+            return None
+    
+    def read_percent(self, entry, name, example, errors):
+        """Parse a percentage entry as a decimal rate, noting problems in errors"""
+        value = self.read_number(entry, name, f"{example} for {example}%", errors)
+        return None if value is None else value / 100
+    
+    def confirm_inputs(self, errors, warnings):
+        """Report every input problem in one dialog; returns whether to go ahead"""
+        from tkinter import messagebox
+        if errors:
+            messagebox.showerror("Input Error", "Please correct the following:\n\n• " + "\n\n• ".join(errors))
+            return False
+        if warnings:
+            return messagebox.askyesno("Confirm Input", "• " + "\n\n• ".join(warnings) + "\n\nContinue anyway?")
+        return True
+    
+    def offer_export(self, title, summary):
+        """Show a calculation summary with an export prompt, if summaries are on"""
+        from tkinter import messagebox
+        if not self.show_summaries.get():
+            return
+        
+        result = messagebox.askquestion(title, 
+            summary + "\n\nWould you like to export or save this calculation?",
+            icon='question')
+        
+        if result == 'yes':
+            self.export_current_calculation()
+    
     # Data Management Methods
     def load_history(self):
         """Load calculation history from file"""
@@ -1569,6 +1623,7 @@ class FinanceCalculator:
     
     def add_to_favorites(self, name, calculation_type, inputs, results, description=""):
         """Add a calculation to favorites"""
+        from tkinter import messagebox
         favorite_entry = {
             'name': name,
             'timestamp': datetime.now().isoformat(),
@@ -1584,6 +1639,8 @@ class FinanceCalculator:
     
     def export_to_csv(self, data, filename):
         """Export calculation data to CSV"""
+        import csv
+        from tkinter import messagebox
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
                 if not data:
@@ -1723,21 +1780,22 @@ class FinanceCalculator:
         
         export_btn = tk.Button(button_frame, text="Export History to CSV", 
                               command=self.export_history_csv,
-                              bg='#d4d4d2', fg='#1c1c1e', font=('SF Pro Display', 12))
+                              font=('SF Pro Display', 12))
         export_btn.pack(side='left', padx=(0, 10))
         
         clear_btn = tk.Button(button_frame, text="Clear History", 
                              command=self.clear_history,
-                             bg='#d4d4d2', fg='#1c1c1e', font=('SF Pro Display', 12))
+                             font=('SF Pro Display', 12))
         clear_btn.pack(side='left')
         
         close_btn = tk.Button(button_frame, text="Close", 
                              command=history_window.destroy,
-                             bg='#d4d4d2', fg='#1c1c1e', font=('SF Pro Display', 12))
+                             font=('SF Pro Display', 12))
         close_btn.pack(side='right')
     
     def export_history_csv(self):
         """Export calculation history to CSV file"""
+        from tkinter import messagebox
         if not self.calculation_history:
             messagebox.showwarning("No Data", "No calculation history to export.")
             return
@@ -1754,6 +1812,7 @@ class FinanceCalculator:
     
     def clear_history(self):
         """Clear calculation history"""
+        from tkinter import messagebox
         result = messagebox.askyesno("Confirm Clear", 
             "Are you sure you want to clear all calculation history?\n\nThis action cannot be undone.")
         
@@ -1764,6 +1823,7 @@ class FinanceCalculator:
     
     def save_current_calculation(self):
         """Save current calculation to favorites"""
+        from tkinter import messagebox, simpledialog
         if not self.last_calculation_data:
             messagebox.showwarning("No Calculation", "No recent calculation to save.")
             return
@@ -1831,21 +1891,22 @@ class FinanceCalculator:
         
         export_btn = tk.Button(button_frame, text="Export Favorites to CSV", 
                               command=self.export_favorites_csv,
-                              bg='#d4d4d2', fg='#1c1c1e', font=('SF Pro Display', 12))
+                              font=('SF Pro Display', 12))
         export_btn.pack(side='left', padx=(0, 10))
         
         clear_btn = tk.Button(button_frame, text="Clear Favorites", 
                              command=self.clear_favorites,
-                             bg='#d4d4d2', fg='#1c1c1e', font=('SF Pro Display', 12))
+                             font=('SF Pro Display', 12))
         clear_btn.pack(side='left', padx=(0, 10))
         
         close_btn = tk.Button(button_frame, text="Close", 
                              command=favorites_window.destroy,
-                             bg='#d4d4d2', fg='#1c1c1e', font=('SF Pro Display', 12))
+                             font=('SF Pro Display', 12))
         close_btn.pack(side='right')
     
     def export_favorites_csv(self):
         """Export favorite calculations to CSV file"""
+        from tkinter import messagebox
         if not self.favorites:
             messagebox.showwarning("No Data", "No favorite calculations to export.")
             return
@@ -1862,6 +1923,7 @@ class FinanceCalculator:
     
     def clear_favorites(self):
         """Clear all favorite calculations"""
+        from tkinter import messagebox
         if not self.favorites:
             messagebox.showinfo("No Data", "No favorite calculations to clear.")
             return
@@ -1891,6 +1953,7 @@ class FinanceCalculator:
     
     def export_current_calculation(self):
         """Export the current calculation to CSV"""
+        from tkinter import messagebox
         if not self.last_calculation_data:
             messagebox.showwarning("No Data", "No recent calculation to export.\n\nPlease perform a calculation first.")
             return
@@ -1958,6 +2021,7 @@ if __name__ == "__main__":
     
     def add_to_favorites(self, calculation_type, inputs, results, name=None):
         """Add calculation to favorites"""
+        from tkinter import messagebox
         if name is None:
             name = f"{calculation_type.upper()} - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
         
@@ -1976,6 +2040,8 @@ if __name__ == "__main__":
     
     def export_to_csv(self, data, filename):
         """Export calculation data to CSV"""
+        import csv
+        from tkinter import messagebox
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
                 if data['type'] == 'npv':
@@ -2063,6 +2129,7 @@ if __name__ == "__main__":
     
     def show_history_window(self):
         """Show calculation history window"""
+        from tkinter import messagebox
         history_window = tk.Toplevel(self.root)
         history_window.title("Calculation History")
         history_window.geometry("600x400")
@@ -2132,6 +2199,7 @@ if __name__ == "__main__":
     
     def show_favorites_window(self):
         """Show favorites window"""
+        from tkinter import messagebox
         favorites_window = tk.Toplevel(self.root)
         favorites_window.title("Favorite Calculations")
         favorites_window.geometry("600x400")
@@ -2194,6 +2262,7 @@ if __name__ == "__main__":
     
     def load_calculation(self, entry):
         """Load a calculation from history or favorites"""
+        from tkinter import messagebox
         calc_type = entry['type']
         inputs = entry['inputs']
         
@@ -2205,12 +2274,10 @@ if __name__ == "__main__":
             self.rate_entry.delete(0, tk.END)
             self.rate_entry.insert(0, str(inputs['discount_rate']))
             
-            self.cashflows_entry.delete("1.0", tk.END)
-            self.cashflows_entry.insert("1.0", ', '.join(map(str, inputs['cash_flows'])))
+            self.cashflows_var.set(', '.join(map(str, inputs['cash_flows'])))
         
         elif calc_type == 'dcf':
-            self.dcf_cashflows_entry.delete("1.0", tk.END)
-            self.dcf_cashflows_entry.insert("1.0", ', '.join(map(str, inputs['cash_flows'])))
+            self.dcf_cashflows_var.set(', '.join(map(str, inputs['cash_flows'])))
             
             self.terminal_growth_entry.delete(0, tk.END)
             self.terminal_growth_entry.insert(0, str(inputs['terminal_growth']))
@@ -2248,6 +2315,7 @@ if __name__ == "__main__":
     
     def export_current_calculation(self):
         """Export the current calculation results"""
+        from tkinter import messagebox, simpledialog
         if self.current_mode == "basic":
             messagebox.showinfo("Export Info", "Basic calculator mode doesn't have exportable calculations.\n\nPlease use NPV, DCF, Cash Flow, or Bond modes for export functionality.")
             return
@@ -3,6 +3,7 @@
 Simple tests for the finance calculator
 """
 
+import numpy as np
 from finance_utils import FinancialCalculations
 
 def test_npv():
@@ -17,7 +18,103 @@ def test_npv():
     # Manual verification: -1000 + 300/1.1 + 400/1.1^2 + 500/1.1^3
     manual_npv = -1000 + 300/1.1 + 400/(1.1**2) + 500/(1.1**3)
     print(f"Manual verification: ${manual_npv:.2f}")
+    assert abs(npv - manual_npv) < 1e-9
     
+def test_npv_batch():
+    """Test batched NPV across rates and scenarios"""
+    rates = np.array([0.05, 0.10, 0.15])
+    scenarios = np.array([
+        [-1000, 300, 400, 500],
+        [-2000, 800, 800, 800],
+    ])
+    
+    npvs = FinancialCalculations.npv_batch(rates, scenarios)
+    print(f"\nNPV Batch Test: shape {npvs.shape}")
+    
+    assert npvs.shape == (3, 2)
+    for i, rate in enumerate(rates):
+        for j, cashflows in enumerate(scenarios):
+            assert abs(npvs[i, j] - FinancialCalculations.npv(rate, cashflows)) < 1e-9
+    
+def test_irr():
+    """Test IRR calculation"""
+    cashflows = [-1000, 300, 400, 500]
+    
+    irr = FinancialCalculations.irr(cashflows)
+    print(f"\nIRR Test: {irr:.4%}")
+    
+    # NPV at the IRR should be zero
+    assert irr is not None
+    assert abs(FinancialCalculations.npv(irr, cashflows)) < 1e-6
+    
+    # No sign change in NPV means there is no IRR
+    assert FinancialCalculations.irr([100, 200, 300]) is None
+    
+    # A double root never changes sign; the polynomial-root fallback finds it
+    assert abs(FinancialCalculations.irr([1, -2.4, 1.44]) - 0.2) < 1e-6
+    
+    # Non-finite cash flows have no IRR
+    assert FinancialCalculations.irr([-1000, float('nan'), 500]) is None
+    assert FinancialCalculations.irr([-1000, float('inf'), 500]) is None
+    
+    # With two IRRs (10% and 20%), the one nearest the guess is returned
+    assert abs(FinancialCalculations.irr([-100, 230, -132], guess=0.05) - 0.1) < 1e-6
+    assert abs(FinancialCalculations.irr([-100, 230, -132], guess=0.25) - 0.2) < 1e-6
+    
+    # A small late outflow adds a spurious root near -80%; the genuine IRR wins
+    project = [-2134, 4723, 2146, 1506, 2549, 4676, 1774, 3973, 1779, -491]
+    irr = FinancialCalculations.irr(project)
+    assert irr > 1.0
+    assert abs(FinancialCalculations.npv(irr, project)) < 1e-6
+    assert abs(FinancialCalculations.irr_batch(np.array([project]))[0] - irr) < 1e-9
+    
+def test_irr_batch():
+    """Test batched IRR across scenarios"""
+    scenarios = np.array([
+        [-1000, 300, 400, 500],
+        [-10000, 3000, 4000, 5000],
+        [100, 200, 300, 400],
+        [1, -2.4, 1.44, 0],  # Double root at 20%: only the polynomial fallback finds it
+    ])
+    
+    irrs = FinancialCalculations.irr_batch(scenarios)
+    print(f"\nIRR Batch Test: {irrs}")
+    
+    assert abs(irrs[0] - FinancialCalculations.irr(scenarios[0])) < 1e-9
+    assert abs(irrs[1] - FinancialCalculations.irr(scenarios[1])) < 1e-9
+    assert np.isnan(irrs[2])
+    assert abs(irrs[3] - 0.2) < 1e-6
+    
+def test_array_inputs():
+    """Test that parsed NumPy cash flow arrays are accepted like lists"""
+    cashflows = [-1000, 300, 400, 500]
+    array = np.array(cashflows, dtype=np.float64)
+    
+    assert FinancialCalculations.payback_period(array) == FinancialCalculations.payback_period(cashflows)
+    assert abs(FinancialCalculations.payback_period(cashflows) - 2.6) < 1e-12
+    assert FinancialCalculations.payback_period([-1000, 100, 100]) is None
+    assert FinancialCalculations.dcf_valuation(array, 0.02, 0.1) == FinancialCalculations.dcf_valuation(cashflows, 0.02, 0.1)
+    print("\nArray cash flows match list results")
+
+def test_payback_batch():
+    """Test batched payback periods against the scalar version"""
+    scenarios = np.array([
+        [-1000, 300, 400, 500],
+        [-1000, 1200, 0, 0],
+        [-1000, 100, 100, 100],
+        [500, 100, 100, 100],
+    ])
+    
+    paybacks = FinancialCalculations.payback_period_batch(scenarios)
+    print(f"\nPayback Batch Test: {paybacks}")
+    
+    for payback, cashflows in zip(paybacks, scenarios):
+        expected = FinancialCalculations.payback_period(cashflows)
+        if expected is None:
+            assert np.isnan(payback)
+        else:
+            assert abs(payback - expected) < 1e-12
+
 def test_dcf():
     """Test DCF valuation"""
     free_cashflows = [100, 110, 121, 133]  # Growing at 10%
@@ -33,6 +130,11 @@ def test_dcf():
     print(f"Terminal Value: ${result['terminal_value']:.2f}")
     print(f"PV of Terminal Value: ${result['pv_terminal_value']:.2f}")
     print(f"Enterprise Value: ${result['enterprise_value']:.2f}")
+    
+    # Manual verification of the discounted cash flows
+    manual_pv = sum(cf / 1.12 ** (i + 1) for i, cf in enumerate(free_cashflows))
+    assert abs(result['pv_cashflows'] - manual_pv) < 1e-9
+    assert abs(result['pv_terminal_value'] - result['terminal_value'] / 1.12 ** 4) < 1e-9
 
 def test_wacc():
     """Test WACC calculation"""
@@ -45,6 +147,47 @@ def test_wacc():
     )
     print(f"\nWACC Test: {wacc:.2%}")
 
+def test_time_value():
+    """Test CAGR, present value and future value"""
+    cagr = FinancialCalculations.compound_annual_growth_rate(100, 100 * 1.08 ** 5, 5)
+    assert abs(cagr - 0.08) < 1e-12
+    assert FinancialCalculations.compound_annual_growth_rate(100, 0, 5) == -1.0
+    
+    assert abs(FinancialCalculations.present_value(121, 0.10, 2) - 100) < 1e-9
+    assert abs(FinancialCalculations.future_value(100, 0.10, 2) - 121) < 1e-9
+    
+    # Small rates take the log1p/expm1 path
+    assert abs(FinancialCalculations.future_value(100, 1e-6, 10) - 100 * (1 + 1e-6) ** 10) < 1e-9
+    print(f"\nTime Value Test: CAGR {cagr:.2%}")
+
+def test_bond_duration_closed_form():
+    """Test closed-form duration against explicit cash flow weighting"""
+    for face, coupon, yld, years, freq in [(1000, 0.05, 0.06, 10, 2), (1000, 0.08, 0.03, 30, 12),
+                                           (1000, 0.05, 0.0, 10, 2), (1000, 0.0, 0.05, 10, 2),
+                                           (1000, 0.05, 1e-9, 10, 2), (1000, 0.05, 1e-6, 10, 2),
+                                           (1000, 0.05, -1e-9, 10, 2), (1000, 0.05, 1e-9, 1, 2)]:
+        result = FinancialCalculations.bond_price(face, coupon, yld, years, freq)
+        
+        periods = years * freq
+        t = np.arange(1, periods + 1)
+        cash_flows = np.full(periods, face * coupon / freq)
+        cash_flows[-1] += face
+        pv = cash_flows / (1 + yld / freq) ** t
+        expected = (t / freq * pv).sum() / pv.sum()
+        
+        assert abs(result['duration'] - expected) < 1e-9
+    print("\nClosed-form duration matches explicit weighting")
+
+def test_ytm_round_trip():
+    """Test Halley YTM recovers the pricing yield"""
+    for face, coupon, yld, years, freq in [(1000, 0.05, 0.06, 10, 2), (1000, 0.08, 0.03, 30, 12), (1000, 0.0, 0.04, 5, 1)]:
+        price = FinancialCalculations.bond_price(face, coupon, yld, years, freq)['bond_price']
+        ytm = FinancialCalculations.yield_to_maturity(price, face, coupon, years, freq)
+        
+        assert ytm is not None
+        assert abs(ytm - yld) < 1e-4
+    print("\nYTM round trip recovers pricing yields")
+
 def test_bond_valuation():
     """Test bond valuation"""
     # Example: $1000 face value, 5% coupon, 6% yield, 10 years, semi-annual
@@ -60,6 +203,8 @@ def test_bond_valuation():
     print(f"Bond Price: ${bond_result['bond_price']:.2f}")
     print(f"Current Yield: {bond_result['current_yield']:.2%}")
     print(f"Duration: {bond_result['duration']:.2f} years")
+    assert abs(bond_result['bond_price'] - 925.61) < 0.01
+    assert abs(bond_result['duration'] - 7.89) < 0.01
     
     # Test YTM calculation
     ytm = FinancialCalculations.yield_to_maturity(
@@ -72,10 +217,29 @@ def test_bond_valuation():
     
     if ytm:
         print(f"YTM Test: {ytm:.2%}")
+    
+    # YTM of the exact model price should recover the input yield
+    ytm_exact = FinancialCalculations.yield_to_maturity(
+        bond_price=bond_result['bond_price'],
+        face_value=1000,
+        coupon_rate=0.05,
+        years_to_maturity=10,
+        payments_per_year=2
+    )
+    assert ytm_exact is not None
+    assert abs(ytm_exact - 0.06) < 1e-4
 
 if __name__ == "__main__":
     test_npv()
+    test_npv_batch()
+    test_irr()
+    test_irr_batch()
+    test_array_inputs()
+    test_payback_batch()
     test_dcf()
     test_wacc()
+    test_time_value()
     test_bond_valuation()
+    test_bond_duration_closed_form()
+    test_ytm_round_trip()
     print("\nAll tests completed!")
\ No newline at end of file